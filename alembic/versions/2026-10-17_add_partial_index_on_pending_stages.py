@@ -0,0 +1,35 @@
+"""add partial index on incomplete stages per purchase
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-17 00:00:02.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f6a7b8c9d0e1"
+down_revision: Union[str, None] = "e5f6a7b8c9d0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # cost.purchase_id is already indexed by e5f6a7b8c9d0
+    op.create_index(
+        "ix_stage_purchase_priority_pending",
+        "stage",
+        ["purchase_id", "priority", "stage_type_id"],
+        unique=False,
+        postgresql_where=sa.text("completion_date IS NULL"),
+        sqlite_where=sa.text("completion_date IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_stage_purchase_priority_pending", table_name="stage")
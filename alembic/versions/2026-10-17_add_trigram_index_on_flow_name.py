@@ -0,0 +1,38 @@
+"""add trigram index on predefined_flow.flow_name
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e5f6a7b8c9"
+down_revision: Union[str, None] = "c3d4e5f6a7b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # flow_name is already UNIQUE since the initial migration
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            "ix_predefined_flow_flow_name_trgm",
+            "predefined_flow",
+            ["flow_name"],
+            postgresql_using="gin",
+            postgresql_ops={"flow_name": "gin_trgm_ops"},
+        )
+    else:
+        op.create_index(
+            "ix_predefined_flow_flow_name_trgm", "predefined_flow", ["flow_name"]
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_predefined_flow_flow_name_trgm", table_name="predefined_flow")
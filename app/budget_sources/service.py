@@ -1,4 +1,4 @@
-from sqlalchemy import select
+from sqlalchemy import RowMapping, select
 from sqlalchemy.orm import Session
 
 from app.budget_sources.exceptions import (
@@ -7,7 +7,7 @@ from app.budget_sources.exceptions import (
 )
 from app.budget_sources.models import BudgetSource
 from app.budget_sources.schemas import BudgetSourceCreate, BudgetSourceUpdate
-from app.pagination import PaginationParams, paginate_select
+from app.pagination import PaginationParams, paginate_select_raw
 
 
 def get_budget_source(db: Session, budget_source_id: int) -> BudgetSource | None:
@@ -18,7 +18,7 @@ def get_budget_source(db: Session, budget_source_id: int) -> BudgetSource | None
 
 def get_budget_sources(
     db: Session, pagination: PaginationParams, search: str | None = None
-) -> tuple[list[BudgetSource], int]:
+) -> tuple[list[RowMapping], int]:
     """
     Get budget sources with pagination and optional search.
 
@@ -30,7 +30,7 @@ def get_budget_sources(
     Returns:
         Tuple of (budget sources list, total count)
     """
-    stmt = select(BudgetSource)
+    stmt = select(BudgetSource.__table__)
 
     # Apply search filter if provided
     if search:
@@ -39,7 +39,7 @@ def get_budget_sources(
     # Apply ordering
     stmt = stmt.order_by(BudgetSource.name)
 
-    return paginate_select(db, stmt, pagination)
+    return paginate_select_raw(db, stmt, pagination)
 
 
 def create_budget_source(
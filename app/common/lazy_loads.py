@@ -0,0 +1,57 @@
+"""Development aid that reports relationship lazy loads.
+
+Lazy loads fired while serializing responses are the usual source of N+1 query
+patterns. When enabled, every lazy load is logged (or raised) with the model
+and relationship that triggered it, so the missing loader option can be added
+at the service layer.
+"""
+
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+logger = logging.getLogger(__name__)
+
+
+class LazyLoadDetected(Exception):
+    """Raised for a relationship lazy load while detection runs in raise mode."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.message = f"Unexpected lazy load of {path}"
+        super().__init__(self.message)
+
+
+_raise_on_lazy_load = False
+
+
+def _describe_lazy_load(orm_execute_state: ORMExecuteState) -> str:
+    """Describe the model and relationship being lazy loaded."""
+    state = orm_execute_state.lazy_loaded_from
+    relationship = orm_execute_state.loader_strategy_path[-1]
+    return f"{state.class_.__name__}.{relationship.key}"
+
+
+def _report_lazy_load(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.lazy_loaded_from is None:
+        return
+
+    path = _describe_lazy_load(orm_execute_state)
+    if _raise_on_lazy_load:
+        raise LazyLoadDetected(path)
+    logger.warning("Lazy load of %s", path)
+
+
+def enable_lazy_load_detection(raise_on_lazy_load: bool = False) -> None:
+    """Start reporting lazy loads on every Session (including AsyncSession)."""
+    global _raise_on_lazy_load
+    _raise_on_lazy_load = raise_on_lazy_load
+    if not event.contains(Session, "do_orm_execute", _report_lazy_load):
+        event.listen(Session, "do_orm_execute", _report_lazy_load)
+
+
+def disable_lazy_load_detection() -> None:
+    """Stop reporting lazy loads."""
+    if event.contains(Session, "do_orm_execute", _report_lazy_load):
+        event.remove(Session, "do_orm_execute", _report_lazy_load)
@@ -0,0 +1,72 @@
+"""Conversion between nested stage lists and flat (priority, item) pairs.
+
+Stages are submitted and serialized as a nested list where each position is a
+priority and a sub-list holds several stages sharing it, e.g. [a, [b, c], d].
+Internally they are handled as flat (priority, item) pairs and only regrouped
+at the serialization boundary.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from itertools import groupby
+from operator import attrgetter
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def flatten_by_priority(items: Iterable[T | list[T]]) -> Iterator[tuple[int, T]]:
+    """
+    Yield (priority, item) pairs from a nested stage list, priorities from 1.
+
+    Example:
+        Input: [a, [b, c], d]
+        Output: (1, a), (2, b), (2, c), (3, d)
+    """
+    for priority, item in enumerate(items, start=1):
+        if isinstance(item, list):
+            for sub_item in item:
+                yield priority, sub_item
+        else:
+            yield priority, item
+
+
+def priority_groups(
+    stages: Iterable[Any], value: Callable[[Any], T] | None = None
+) -> list[list[T]]:
+    """
+    Group objects with a priority attribute into one list per priority.
+
+    Args:
+        stages: Objects exposing a priority attribute, in any order
+        value: Optional function applied to each object before grouping
+
+    Returns:
+        Lists of values ordered by priority, singletons included as length-1 lists
+    """
+    ordered = sorted(stages, key=attrgetter("priority"))
+    return [
+        [value(stage) for stage in group] if value else list(group)
+        for _, group in groupby(ordered, key=attrgetter("priority"))
+    ]
+
+
+def unwrap_singletons(groups: Iterable[list[T]]) -> list[T | list[T]]:
+    """Convert priority groups to the nested format, unwrapping length-1 groups."""
+    return [group[0] if len(group) == 1 else group for group in groups]
+
+
+def group_by_priority(
+    stages: Iterable[Any], value: Callable[[Any], T] | None = None
+) -> list[T | list[T]]:
+    """
+    Group objects with a priority attribute into the nested stage list format.
+
+    Args:
+        stages: Objects exposing a priority attribute, in any order
+        value: Optional function applied to each object before packing
+
+    Returns:
+        One entry per priority: the single value, or a list when several
+        objects share the priority
+    """
+    return unwrap_singletons(priority_groups(stages, value))
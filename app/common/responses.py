@@ -0,0 +1,23 @@
+"""JSON responses built straight from validated Pydantic models."""
+
+from typing import Any
+
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def json_response(
+    model: BaseModel, status_code: int = 200, **dump_kwargs: Any
+) -> Response:
+    """
+    Serialize an already-validated model directly into a JSON response.
+
+    Returning the model itself would have FastAPI dump it to a dict, validate it
+    against response_model and encode it again; this dumps it to JSON once.
+    Extra keyword arguments are passed to model_dump_json (e.g. exclude).
+    """
+    return Response(
+        content=model.model_dump_json(**dump_kwargs),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -0,0 +1,46 @@
+"""Small in-process cache with per-entry expiry."""
+
+import time
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLCache:
+    """
+    In-process key/value cache whose entries expire after a fixed TTL.
+
+    The cache is local to the worker process, so writes only invalidate the
+    entries of the process that handled them; other workers converge once
+    their entries expire. A TTL of 0 disables caching.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value for key until the TTL elapses."""
+        if self.ttl_seconds <= 0:
+            return
+
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            # Evict the oldest entry to keep memory bounded
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
@@ -9,12 +9,20 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class Settings(BaseSettings):
     # Database
     database_url: Annotated[str, Field(default="sqlite:///./app.db")]
+    # Sync and async engines keep separate pools; defaults total 40 per worker
+    db_pool_size: Annotated[int, Field(default=10)]
+    db_max_overflow: Annotated[int, Field(default=10)]
+    db_async_pool_size: Annotated[int, Field(default=10)]
+    db_async_max_overflow: Annotated[int, Field(default=10)]
+    db_pool_recycle_seconds: Annotated[int, Field(default=1800)]
 
     # App
     app_name: Annotated[str, Field(default="Procurement Management System")]
     debug: Annotated[bool, Field(default=False)]
     version: Annotated[str, Field(default="1.0.0")]
     environment: Annotated[str, Field(default="development")]
+    # Report relationship lazy loads outside production: "off", "warn" or "raise"
+    lazy_load_detection: Annotated[str, Field(default="off")]
 
     # API
     api_v1_prefix: Annotated[str, Field(default="/api/v1")]
@@ -23,6 +31,9 @@ class Settings(BaseSettings):
     default_page_size: Annotated[int, Field(default=100)]
     max_page_size: Annotated[int, Field(default=200)]
 
+    # Response caching (seconds, 0 disables)
+    predefined_flows_cache_ttl_seconds: Annotated[int, Field(default=30)]
+
     # AWS S3 Configuration
     aws_access_key_id: Annotated[str, Field(default="")]
     aws_secret_access_key: Annotated[str, Field(default="")]
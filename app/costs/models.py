@@ -1,7 +1,7 @@
 from enum import Enum as PyEnum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Enum, Float, ForeignKey, Integer, event, text
+from sqlalchemy import Enum, Float, ForeignKey, Integer, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -20,7 +20,9 @@ class Cost(Base):
     __tablename__ = "cost"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    purchase_id: Mapped[int] = mapped_column(ForeignKey("purchase.id"), nullable=False)
+    purchase_id: Mapped[int] = mapped_column(
+        ForeignKey("purchase.id"), nullable=False, index=True
+    )
     currency: Mapped[CurrencyEnum] = mapped_column(Enum(CurrencyEnum), nullable=False)
     amount: Mapped[float] = mapped_column(Float, nullable=False)
 
@@ -32,15 +34,10 @@ class Cost(Base):
 @event.listens_for(Cost, "after_insert")
 @event.listens_for(Cost, "after_update")
 @event.listens_for(Cost, "after_delete")
-def _update_purpose_on_cost_change(_mapper, connection, target: Cost) -> None:
+def _update_purpose_on_cost_change(_mapper, _connection, target: Cost) -> None:
     """Update Purpose.last_modified when Cost changes."""
     if hasattr(target, "purchase_id") and target.purchase_id:
-        # Query for purpose_id through purchase
-        result = connection.execute(
-            text("SELECT purpose_id FROM purchase WHERE id = :purchase_id"),
-            {"purchase_id": target.purchase_id},
-        ).fetchone()
-        if result and result[0]:
-            from app.purposes.models import update_purpose_last_modified
-
-            update_purpose_last_modified(connection, result[0])
+        # The owning purpose is resolved in the single end-of-flush UPDATE
+        from app.purposes.models import queue_purchase_purpose_last_modified
+
+        queue_purchase_purpose_last_modified(target, target.purchase_id)
@@ -1,19 +1,60 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from .config import settings
 
+# Async driver used for each sync database backend
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """Return the async-driver equivalent of a sync database URL."""
+    url = make_url(database_url)
+    async_driver = ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername)
+    return url.set(drivername=async_driver).render_as_string(hide_password=False)
+
+
+is_sqlite = settings.database_url.startswith("sqlite")
+
+
+def get_pool_options(pool_size: int, max_overflow: int) -> dict:
+    """Return engine pool options, or none for SQLite's default pool."""
+    if is_sqlite:
+        return {}
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+    }
+
+
+# Pool sizing applies per engine and per worker process: the sync and async
+# engines each keep their own pool, so the sum of both engines' pool_size and
+# max_overflow times the number of workers must stay below the database's
+# max_connections (100 by default on PostgreSQL; the defaults use 40 per worker).
 engine = create_engine(
     settings.database_url,
-    connect_args=(
-        {"check_same_thread": False}
-        if settings.database_url.startswith("sqlite")
-        else {}
-    ),
+    connect_args={"check_same_thread": False} if is_sqlite else {},
     echo=settings.debug,
+    pool_pre_ping=True,
+    **get_pool_options(settings.db_pool_size, settings.db_max_overflow),
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for routes running on AsyncSession; Alembic and scripts keep the sync engine
+async_engine = create_async_engine(
+    get_async_database_url(settings.database_url),
+    echo=settings.debug,
+    pool_pre_ping=True,
+    **get_pool_options(settings.db_async_pool_size, settings.db_async_max_overflow),
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False)
+
 
 class Base(DeclarativeBase):
     pass
@@ -26,3 +67,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Async database dependency."""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,4 +1,4 @@
-from sqlalchemy import and_, func, select
+from sqlalchemy import RowMapping, and_, func, select
 from sqlalchemy.orm import Session, selectinload
 
 from app.hierarchies.exceptions import (
@@ -12,7 +12,7 @@ from app.hierarchies.exceptions import (
 )
 from app.hierarchies.models import Hierarchy
 from app.hierarchies.schemas import HierarchyCreate, HierarchyUpdate
-from app.pagination import PaginationParams, paginate_select
+from app.pagination import PaginationParams, paginate_select_raw
 
 
 def _calculate_path(db: Session, parent_id: int | None, name: str) -> str:
@@ -47,9 +47,9 @@ def get_hierarchies(
     search: str | None = None,
     sort_by: str = "name",
     sort_order: str = "asc",
-) -> tuple[list[Hierarchy], int]:
+) -> tuple[list[RowMapping], int]:
     """Get hierarchies with filtering, searching, sorting, and pagination."""
-    stmt = select(Hierarchy)
+    stmt = select(Hierarchy.__table__)
 
     # Apply filters
     if type_filter:
@@ -70,7 +70,7 @@ def get_hierarchies(
         stmt = stmt.order_by(sort_column.asc())
 
     # Apply pagination
-    return paginate_select(db, stmt, pagination)
+    return paginate_select_raw(db, stmt, pagination)
 
 
 def get_hierarchy_by_id(db: Session, hierarchy_id: int) -> Hierarchy:
@@ -1,10 +1,12 @@
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .analytics.router import router as analytics_router
 from .auth.dependencies import require_admin, require_auth
 from .auth.router import router as auth_router
 from .budget_sources.router import router as budget_sources_router
+from .common.lazy_loads import enable_lazy_load_detection
 from .config import settings
 from .files.router import router as files_router
 from .hierarchies.router import router as hierarchies_router
@@ -32,8 +34,15 @@ app = FastAPI(
     version=settings.version,
     debug=settings.debug,
     swagger_ui_init_oauth=swagger_ui_init_oauth,
+    default_response_class=ORJSONResponse,
 )
 
+# Development aid: surface N+1 lazy loads (never enabled in production)
+if settings.environment != "production" and settings.lazy_load_detection != "off":
+    enable_lazy_load_detection(
+        raise_on_lazy_load=settings.lazy_load_detection == "raise"
+    )
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
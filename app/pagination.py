@@ -1,7 +1,11 @@
+import base64
+import binascii
+import json
 from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, Field, computed_field
-from sqlalchemy import Select, func, select
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+from sqlalchemy import RowMapping, Select, func, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from .config import settings
@@ -18,6 +22,8 @@ class PaginationParams(BaseModel):
         description="Items per page",
     )
 
+    model_config = ConfigDict(frozen=True)
+
     @property
     def offset(self) -> int:
         return (self.page - 1) * self.limit
@@ -29,6 +35,8 @@ class PaginatedResult(BaseModel, Generic[T]):
     page: int = Field(ge=1)
     limit: int = Field(ge=1)
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     @computed_field
     @property
     def pages(self) -> int:
@@ -45,6 +53,75 @@ class PaginatedResult(BaseModel, Generic[T]):
         return self.page > 1
 
 
+class CursorPaginationParams(BaseModel):
+    cursor: str | None = Field(
+        None, description="Opaque cursor from a previous page's next_cursor"
+    )
+    limit: int = Field(
+        settings.default_page_size,
+        ge=1,
+        le=settings.max_page_size,
+        description="Items per page",
+    )
+
+    model_config = ConfigDict(frozen=True)
+
+
+class CursorPaginatedResult(BaseModel, Generic[T]):
+    items: list[T]
+    limit: int = Field(ge=1)
+    next_cursor: str | None = None
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    @computed_field
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        self.message = "Invalid pagination cursor"
+        super().__init__(self.message)
+
+
+def encode_cursor(key: tuple) -> str:
+    """Encode a keyset sort key as an opaque URL-safe cursor."""
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode()
+
+
+def _matches_column_type(value: Any, column) -> bool:
+    """Check that a decoded cursor value has its key column's Python type."""
+    python_type = column.type.python_type
+    # JSON booleans decode as bool, which isinstance treats as an int
+    if isinstance(value, bool) and python_type is not bool:
+        return False
+    return isinstance(value, python_type)
+
+
+def decode_cursor(cursor: str, key_columns: list) -> tuple:
+    """
+    Decode a cursor produced by encode_cursor for the given key columns.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed, has the wrong key length or
+            holds a value whose type does not match its key column
+    """
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor(cursor)
+    if not isinstance(key, list) or len(key) != len(key_columns):
+        raise InvalidCursor(cursor)
+    if not all(map(_matches_column_type, key, key_columns)):
+        raise InvalidCursor(cursor)
+    return tuple(key)
+
+
 def paginate_select(
     db: Session, stmt: Select, pagination: PaginationParams
 ) -> tuple[list[Any], int]:
@@ -70,6 +147,107 @@ def paginate_select(
     return items, total
 
 
+async def paginate_select_async(
+    db: AsyncSession, stmt: Select, pagination: PaginationParams
+) -> tuple[list[Any], int]:
+    """
+    Paginate a SQLAlchemy Select statement on an AsyncSession.
+
+    Args:
+        db: Async database session
+        stmt: SQLAlchemy Select statement to paginate
+        pagination: Pagination parameters
+
+    Returns:
+        Tuple of (items list, total_count)
+    """
+    # Get total count
+    count_stmt = select(func.count()).select_from(stmt.subquery())
+    total = (await db.execute(count_stmt)).scalar()
+
+    # Get paginated items
+    items_stmt = stmt.offset(pagination.offset).limit(pagination.limit)
+    items = (await db.execute(items_stmt)).scalars().unique().all()
+
+    return items, total
+
+
+def paginate_select_raw(
+    db: Session, stmt: Select, pagination: PaginationParams
+) -> tuple[list[RowMapping], int]:
+    """
+    Paginate a column-level Select statement, returning row mappings.
+
+    Intended for read-only list endpoints whose response schema matches the
+    selected columns. Skips ORM instantiation and identity-map bookkeeping.
+
+    Args:
+        db: Database session
+        stmt: SQLAlchemy Select statement over table columns to paginate
+        pagination: Pagination parameters
+
+    Returns:
+        Tuple of (row mappings list, total_count)
+    """
+    # Get total count
+    count_stmt = select(func.count()).select_from(stmt.subquery())
+    total = db.execute(count_stmt).scalar()
+
+    # Get paginated rows
+    items_stmt = stmt.offset(pagination.offset).limit(pagination.limit)
+    items = db.execute(items_stmt).mappings().all()
+
+    return items, total
+
+
+async def paginate_keyset_async(
+    db: AsyncSession,
+    stmt: Select,
+    key_columns: list,
+    pagination: CursorPaginationParams,
+) -> tuple[list[Any], str | None]:
+    """
+    Paginate a Select statement by seeking past the last seen sort key.
+
+    Unlike OFFSET pagination the cost of a page does not grow with its depth,
+    and no total count is computed. key_columns must uniquely order the rows
+    (e.g. end with the primary key) and replace any existing ORDER BY.
+
+    Args:
+        db: Async database session
+        stmt: SQLAlchemy Select statement to paginate
+        key_columns: Columns forming the sort key, in order
+        pagination: Cursor pagination parameters
+
+    Returns:
+        Tuple of (items list, next_cursor or None on the last page)
+
+    Raises:
+        InvalidCursor: If the cursor cannot be decoded or does not fit key_columns
+    """
+    if pagination.cursor:
+        last_key = decode_cursor(pagination.cursor, key_columns)
+        # Bind each value with its column's type rather than one inferred from JSON
+        last_key_values = (
+            literal(value, column.type) for value, column in zip(last_key, key_columns)
+        )
+        stmt = stmt.where(tuple_(*key_columns) > tuple_(*last_key_values))
+
+    # Fetch one extra row to learn whether another page exists
+    items_stmt = stmt.order_by(None).order_by(*key_columns).limit(pagination.limit + 1)
+    items = (await db.execute(items_stmt)).scalars().unique().all()
+
+    if len(items) <= pagination.limit:
+        return items, None
+
+    items = items[: pagination.limit]
+    last_item = items[-1]
+    next_cursor = encode_cursor(
+        tuple(getattr(last_item, column.key) for column in key_columns)
+    )
+    return items, next_cursor
+
+
 def create_paginated_result(
     items: list[T], total: int, pagination: PaginationParams
 ) -> PaginatedResult[T]:
@@ -0,0 +1,10 @@
+"""In-process cache of serialized predefined flow list responses."""
+
+from app.common.ttl_cache import TTLCache
+from app.config import settings
+
+# Short-lived cache of list responses keyed by (page, limit, search, edit_format).
+# Entries hold the serialized JSON body, so cache hits skip validation and
+# serialization entirely. The bodies embed stage types and their responsible
+# authorities, so the services writing any of those clear it after committing
+flows_list_cache = TTLCache(ttl_seconds=settings.predefined_flows_cache_ttl_seconds)
@@ -1,9 +1,10 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.common.priority_utils import priority_groups
 from app.database import Base
 
 if TYPE_CHECKING:
@@ -31,30 +32,24 @@ class PredefinedFlow(Base):
     )
 
     @property
-    def flow_stages(self) -> list["PredefinedFlowStage | list[PredefinedFlowStage]"]:
-        """Calculate flow stages grouped by priority."""
-        if not self.predefined_flow_stages:
-            return []
-
-        stages_by_priority = {}
-        for stage in self.predefined_flow_stages:
-            if stage.priority not in stages_by_priority:
-                stages_by_priority[stage.priority] = []
-            stages_by_priority[stage.priority].append(stage)
-
-        result = []
-        for priority in sorted(stages_by_priority.keys()):
-            priority_stages = stages_by_priority[priority]
-            if len(priority_stages) == 1:
-                result.append(priority_stages[0])
-            else:
-                result.append(priority_stages)
-
-        return result
+    def flow_stages(self) -> list[list["PredefinedFlowStage"]]:
+        """Calculate flow stages grouped by priority, one list per priority."""
+        return priority_groups(self.predefined_flow_stages)
 
     def __repr__(self) -> str:
         return f"<PredefinedFlow(id={self.id}, name='{self.flow_name}')>"
 
+    # Trigram index so ilike('%term%') flow name search avoids a sequential
+    # scan on PostgreSQL (requires pg_trgm); other dialects get a plain index
+    __table_args__ = (
+        Index(
+            "ix_predefined_flow_flow_name_trgm",
+            "flow_name",
+            postgresql_using="gin",
+            postgresql_ops={"flow_name": "gin_trgm_ops"},
+        ),
+    )
+
 
 class PredefinedFlowStage(Base):
     __tablename__ = "predefined_flow_stage"
@@ -1,15 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dependencies import require_admin
-from app.database import get_db
-from app.pagination import PaginatedResult, PaginationParams, create_paginated_result
+from app.common.responses import json_response
+from app.database import get_async_db
+from app.pagination import (
+    CursorPaginatedResult,
+    CursorPaginationParams,
+    InvalidCursor,
+    PaginatedResult,
+    PaginationParams,
+    create_paginated_result,
+)
 from app.predefined_flows import service
+from app.predefined_flows.cache import flows_list_cache
 from app.predefined_flows.exceptions import (
     InvalidStageTypeId,
     PredefinedFlowAlreadyExists,
     PredefinedFlowNotFound,
 )
+from app.predefined_flows.models import PredefinedFlow
 from app.predefined_flows.schemas import (
     PredefinedFlowCreate,
     PredefinedFlowEditResponse,
@@ -19,12 +30,31 @@ from app.predefined_flows.schemas import (
 
 router = APIRouter()
 
+# Validates a whole page of ORM flows in one call instead of per-item model_validate
+flow_list_adapter = TypeAdapter(list[PredefinedFlowResponse])
+
+
+def _to_list_items(
+    flows: list[PredefinedFlow], edit_format: bool
+) -> list[PredefinedFlowResponse | PredefinedFlowEditResponse]:
+    """Convert already-loaded flows to list response items."""
+    if edit_format:
+        return [service.flow_to_edit_response(flow) for flow in flows]
+    return flow_list_adapter.validate_python(flows, from_attributes=True)
+
 
 @router.get(
     "/",
-    response_model=PaginatedResult[PredefinedFlowResponse | PredefinedFlowEditResponse],
+    response_model=None,
+    responses={
+        200: {
+            "model": PaginatedResult[
+                PredefinedFlowResponse | PredefinedFlowEditResponse
+            ]
+        }
+    },
 )
-def get_predefined_flows(
+async def get_predefined_flows(
     pagination: PaginationParams = Depends(),
     search: str | None = Query(
         None, description="Search predefined flows by flow name (case-insensitive)"
@@ -32,40 +62,87 @@ def get_predefined_flows(
     edit_format: bool = Query(
         False, description="Return flows in edit-friendly format with stage names"
     ),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get all predefined flows with pagination and optional search."""
-    if edit_format:
-        # Get flows and convert to edit format
-        flows, total = service.get_predefined_flows(
-            db=db, pagination=pagination, search=search
-        )
-        edit_flows = []
-        for flow in flows:
-            edit_flow = service.get_predefined_flow_edit_format(db, flow.id)
-            if edit_flow:
-                edit_flows.append(edit_flow)
-        return create_paginated_result(edit_flows, total, pagination)
-    else:
-        flows, total = service.get_predefined_flows(
+    cache_key = (pagination.page, pagination.limit, search, edit_format)
+    cached_body = flows_list_cache.get(cache_key)
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json")
+
+    flows, total = await service.get_predefined_flows(
+        db=db, pagination=pagination, search=search
+    )
+    items = _to_list_items(flows, edit_format)
+
+    result = create_paginated_result(items, total, pagination)
+    response = json_response(result)
+    flows_list_cache.set(cache_key, response.body)
+    return response
+
+
+@router.get(
+    "/cursor",
+    response_model=None,
+    responses={
+        200: {
+            "model": CursorPaginatedResult[
+                PredefinedFlowResponse | PredefinedFlowEditResponse
+            ]
+        }
+    },
+)
+async def get_predefined_flows_cursor(
+    pagination: CursorPaginationParams = Depends(),
+    search: str | None = Query(
+        None, description="Search predefined flows by flow name (case-insensitive)"
+    ),
+    edit_format: bool = Query(
+        False, description="Return flows in edit-friendly format with stage names"
+    ),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Get predefined flows using keyset pagination.
+
+    Pages are ordered by flow name and fetched by seeking past the cursor, so
+    deep pages cost the same as the first; no total count is returned.
+    """
+    cache_key = ("cursor", pagination.cursor, pagination.limit, search, edit_format)
+    cached_body = flows_list_cache.get(cache_key)
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json")
+
+    try:
+        flows, next_cursor = await service.get_predefined_flows_keyset(
             db=db, pagination=pagination, search=search
         )
-        return create_paginated_result(flows, total, pagination)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+    result = CursorPaginatedResult(
+        items=_to_list_items(flows, edit_format),
+        limit=pagination.limit,
+        next_cursor=next_cursor,
+    )
+    response = json_response(result)
+    flows_list_cache.set(cache_key, response.body)
+    return response
 
 
 @router.get(
     "/{flow_id}", response_model=PredefinedFlowResponse | PredefinedFlowEditResponse
 )
-def get_predefined_flow(
+async def get_predefined_flow(
     flow_id: int,
     edit_format: bool = Query(
         False, description="Return flow in edit-friendly format with stage names"
     ),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get a specific predefined flow by ID."""
     if edit_format:
-        flow = service.get_predefined_flow_edit_format(db, flow_id)
+        flow = await service.get_predefined_flow_edit_format(db, flow_id)
         if not flow:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -73,7 +150,7 @@ def get_predefined_flow(
             )
         return flow
     else:
-        flow = service.get_predefined_flow(db, flow_id)
+        flow = await service.get_predefined_flow(db, flow_id)
         if not flow:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -88,13 +165,13 @@ def get_predefined_flow(
     status_code=status.HTTP_201_CREATED,
     dependencies=[Depends(require_admin)],
 )
-def create_predefined_flow(
+async def create_predefined_flow(
     flow: PredefinedFlowCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Create a new predefined flow."""
     try:
-        return service.create_predefined_flow(db, flow)
+        return await service.create_predefined_flow(db, flow)
     except PredefinedFlowAlreadyExists as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
     except InvalidStageTypeId as e:
@@ -106,14 +183,14 @@ def create_predefined_flow(
     response_model=PredefinedFlowResponse,
     dependencies=[Depends(require_admin)],
 )
-def patch_predefined_flow(
+async def patch_predefined_flow(
     flow_id: int,
     flow_update: PredefinedFlowUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Patch an existing predefined flow."""
     try:
-        return service.patch_predefined_flow(db, flow_id, flow_update)
+        return await service.patch_predefined_flow(db, flow_id, flow_update)
     except PredefinedFlowNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
     except PredefinedFlowAlreadyExists as e:
@@ -127,12 +204,12 @@ def patch_predefined_flow(
     status_code=status.HTTP_204_NO_CONTENT,
     dependencies=[Depends(require_admin)],
 )
-def delete_predefined_flow(
+async def delete_predefined_flow(
     flow_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Delete a predefined flow."""
     try:
-        service.delete_predefined_flow(db, flow_id)
+        await service.delete_predefined_flow(db, flow_id)
     except PredefinedFlowNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
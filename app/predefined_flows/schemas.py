@@ -1,8 +1,9 @@
 from datetime import datetime
 from typing import Annotated
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
+from app.common.priority_utils import unwrap_singletons
 from app.stage_types.schemas import StageTypeResponse
 
 
@@ -36,10 +37,18 @@ class PredefinedFlowUpdate(BaseModel):
 class PredefinedFlowResponse(PredefinedFlowBase):
     id: int
     created_at: datetime
-    flow_stages: list[PredefinedFlowStageResponse | list[PredefinedFlowStageResponse]]
+    # Validated as uniform groups to avoid per-element union resolution; the
+    # serializer restores the public format where singleton groups are unwrapped
+    flow_stages: list[list[PredefinedFlowStageResponse]]
 
     model_config = ConfigDict(from_attributes=True)
 
+    @field_serializer("flow_stages")
+    def serialize_flow_stages(
+        self, flow_stages: list[list[PredefinedFlowStageResponse]]
+    ) -> list[PredefinedFlowStageResponse | list[PredefinedFlowStageResponse]]:
+        return unwrap_singletons(flow_stages)
+
 
 class PredefinedFlowEditResponse(PredefinedFlowBase):
     id: int
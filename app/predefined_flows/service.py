@@ -1,7 +1,20 @@
-from sqlalchemy import select
-from sqlalchemy.orm import Session, joinedload
-
-from app.pagination import PaginationParams, paginate_select
+import asyncio
+from collections import defaultdict
+
+from sqlalchemy import delete, insert, lambda_stmt, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+
+from app.common.priority_utils import flatten_by_priority, group_by_priority
+from app.pagination import (
+    CursorPaginationParams,
+    PaginationParams,
+    paginate_keyset_async,
+    paginate_select_async,
+)
+from app.predefined_flows.cache import flows_list_cache
 from app.predefined_flows.exceptions import (
     InvalidStageTypeId,
     PredefinedFlowAlreadyExists,
@@ -13,101 +26,108 @@ from app.predefined_flows.schemas import (
     PredefinedFlowEditResponse,
     PredefinedFlowUpdate,
 )
+from app.stage_types.loader import StageTypeLoader
 from app.stage_types.models import StageType
 
 
-def get_predefined_flow(db: Session, flow_id: int) -> PredefinedFlow | None:
-    """Get a single predefined flow by ID with eager loaded stages."""
-    stmt = (
-        select(PredefinedFlow)
+async def get_predefined_flow(db: AsyncSession, flow_id: int) -> PredefinedFlow | None:
+    """
+    Get a single predefined flow by ID with eager loaded stages.
+
+    Flow queries add raiseload("*") so any relationship the response needs
+    must be loaded explicitly here; an unplanned lazy load raises instead of
+    silently issuing extra queries. The statement is built as a lambda_stmt so
+    its compiled form is cached and only the flow_id parameter changes per call.
+    """
+    stmt = lambda_stmt(
+        lambda: select(PredefinedFlow)
         .options(
-            joinedload(PredefinedFlow.predefined_flow_stages).joinedload(
-                PredefinedFlowStage.stage_type
-            )
+            joinedload(PredefinedFlow.predefined_flow_stages)
+            .joinedload(PredefinedFlowStage.stage_type)
+            .joinedload(StageType.responsible_authority),
+            raiseload("*"),
         )
         .where(PredefinedFlow.id == flow_id)
     )
-    return db.execute(stmt).scalars().first()
-
-
-def resolve_stage_names_to_ids(
-    db: Session, stages: list[int | str | list[int | str]]
-) -> list[int | list[int]]:
-    """Convert stage names to IDs in the stages structure."""
-    resolved_stages = []
-
-    for stage_item in stages:
-        if isinstance(stage_item, list):
-            # Handle list of stages (same priority)
-            resolved_group = []
-            for stage in stage_item:
-                if isinstance(stage, str):
-                    # Convert name to ID
-                    stmt = select(StageType).where(StageType.name == stage)
-                    stage_type = db.execute(stmt).scalars().first()
-                    if not stage_type:
-                        raise InvalidStageTypeId(stage)
-                    resolved_group.append(stage_type.id)
-                else:
-                    # Already an ID, validate it exists
-                    stmt = select(StageType).where(StageType.id == stage)
-                    stage_type = db.execute(stmt).scalars().first()
-                    if not stage_type:
-                        raise InvalidStageTypeId(stage)
-                    resolved_group.append(stage)
-            resolved_stages.append(resolved_group)
-        else:
-            # Single stage
-            if isinstance(stage_item, str):
-                # Convert name to ID
-                stmt = select(StageType).where(StageType.name == stage_item)
-                stage_type = db.execute(stmt).scalars().first()
-                if not stage_type:
-                    raise InvalidStageTypeId(stage_item)
-                resolved_stages.append(stage_type.id)
-            else:
-                # Already an ID, validate it exists
-                stmt = select(StageType).where(StageType.id == stage_item)
-                stage_type = db.execute(stmt).scalars().first()
-                if not stage_type:
-                    raise InvalidStageTypeId(stage_item)
-                resolved_stages.append(stage_item)
-
-    return resolved_stages
-
-
-def get_predefined_flow_edit_format(
-    db: Session, flow_id: int
-) -> PredefinedFlowEditResponse | None:
-    """Get predefined flow in edit-friendly format with stage names."""
-    flow = get_predefined_flow(db, flow_id)
-    if not flow:
-        return None
+    return (await db.execute(stmt)).scalars().first()
+
+
+def _load_stage_reference(
+    loader: StageTypeLoader, stage: int | str
+) -> asyncio.Future[int | None]:
+    """Queue a stage type name or ID lookup on the loader."""
+    if isinstance(stage, str):
+        return loader.load_by_name(stage)
+    return loader.load_by_id(stage)
+
+
+def _resolved_stage_id(stage: int | str, future: asyncio.Future[int | None]) -> int:
+    """Return the stage type ID from a dispatched lookup, or raise if missing."""
+    stage_type_id = future.result()
+    if stage_type_id is None:
+        raise InvalidStageTypeId(stage)
+    return stage_type_id
 
-    # Convert flow_stages to simple stage names array
-    stages = []
-    for stage_item in flow.flow_stages:
-        if isinstance(stage_item, list):
-            # Multiple stages with same priority
-            stage_names = [stage.stage_type.name for stage in stage_item]
-            stages.append(stage_names)
-        else:
-            # Single stage
-            stages.append(stage_item.stage_type.name)
 
+async def resolve_stage_names_to_ids(
+    db: AsyncSession, stages: list[int | str | list[int | str]]
+) -> list[tuple[int, int]]:
+    """
+    Resolve stage names and IDs in a nested stages list.
+
+    Every referenced name and ID is queued on a StageTypeLoader and resolved
+    with a single query.
+
+    Returns:
+        Flat list of (priority, stage_type_id) pairs, priorities starting from 1
+    """
+    loader = StageTypeLoader(db)
+    lookups = [
+        (priority, stage, _load_stage_reference(loader, stage))
+        for priority, stage in flatten_by_priority(stages)
+    ]
+    await loader.dispatch()
+
+    return [
+        (priority, _resolved_stage_id(stage, future))
+        for priority, stage, future in lookups
+    ]
+
+
+def flow_to_edit_response(flow: PredefinedFlow) -> PredefinedFlowEditResponse:
+    """Convert a loaded predefined flow to edit-friendly format with stage names."""
+    stages = group_by_priority(
+        flow.predefined_flow_stages, value=lambda stage: stage.stage_type.name
+    )
     return PredefinedFlowEditResponse(
         id=flow.id, flow_name=flow.flow_name, created_at=flow.created_at, stages=stages
     )
 
 
+async def get_predefined_flow_edit_format(
+    db: AsyncSession, flow_id: int
+) -> PredefinedFlowEditResponse | None:
+    """Get predefined flow in edit-friendly format with stage names."""
+    flow = await get_predefined_flow(db, flow_id)
+    if not flow:
+        return None
+
+    return flow_to_edit_response(flow)
+
+
 def get_predefined_flow_by_name(db: Session, flow_name: str) -> PredefinedFlow:
-    """Get a single predefined flow by name with eager loaded stages."""
-    stmt = (
-        select(PredefinedFlow)
+    """
+    Get a single predefined flow by name with eager loaded stages.
+
+    Synchronous, since purchase creation looks flows up on its own Session.
+    """
+    stmt = lambda_stmt(
+        lambda: select(PredefinedFlow)
         .options(
-            joinedload(PredefinedFlow.predefined_flow_stages).joinedload(
-                PredefinedFlowStage.stage_type
-            )
+            joinedload(PredefinedFlow.predefined_flow_stages)
+            .joinedload(PredefinedFlowStage.stage_type)
+            .joinedload(StageType.responsible_authority),
+            raiseload("*"),
         )
         .where(PredefinedFlow.flow_name == flow_name)
     )
@@ -117,8 +137,23 @@ def get_predefined_flow_by_name(db: Session, flow_name: str) -> PredefinedFlow:
     return flow
 
 
-def get_predefined_flows(
-    db: Session, pagination: PaginationParams, search: str | None = None
+def get_flow_stage_pairs_by_name(
+    db: Session, flow_name: str
+) -> tuple[int, list[tuple[int, int]]]:
+    """
+    Get a predefined flow's ID and (priority, stage_type_id) pairs by name.
+
+    Read in the caller's transaction rather than cached, so the returned ID
+    always refers to an existing flow and the pairs match its current stages.
+    """
+    flow = get_predefined_flow_by_name(db, flow_name)
+    return flow.id, [
+        (stage.priority, stage.stage_type_id) for stage in flow.predefined_flow_stages
+    ]
+
+
+async def get_predefined_flows(
+    db: AsyncSession, pagination: PaginationParams, search: str | None = None
 ) -> tuple[list[PredefinedFlow], int]:
     """
     Get predefined flows with pagination and optional search.
@@ -131,73 +166,100 @@ def get_predefined_flows(
     Returns:
         Tuple of (flows list, total count)
     """
+    stmt = _get_flows_list_select(search)
+
+    # Apply ordering
+    stmt = stmt.order_by(PredefinedFlow.flow_name)
+
+    return await paginate_select_async(db, stmt, pagination)
+
+
+async def get_predefined_flows_keyset(
+    db: AsyncSession, pagination: CursorPaginationParams, search: str | None = None
+) -> tuple[list[PredefinedFlow], str | None]:
+    """
+    Get predefined flows ordered by (flow_name, id) using keyset pagination.
+
+    Args:
+        db: Database session
+        pagination: Cursor pagination parameters
+        search: Optional search term for flow name (case-insensitive)
+
+    Returns:
+        Tuple of (flows list, next page cursor or None)
+
+    Raises:
+        InvalidCursor: If the cursor cannot be decoded
+    """
+    return await paginate_keyset_async(
+        db,
+        _get_flows_list_select(search),
+        [PredefinedFlow.flow_name, PredefinedFlow.id],
+        pagination,
+    )
+
+
+def _get_flows_list_select(search: str | None):
+    """Build the flow list select with eager loads and optional name search."""
     stmt = select(PredefinedFlow).options(
-        joinedload(PredefinedFlow.predefined_flow_stages).joinedload(
-            PredefinedFlowStage.stage_type
-        )
+        selectinload(PredefinedFlow.predefined_flow_stages)
+        .joinedload(PredefinedFlowStage.stage_type)
+        .joinedload(StageType.responsible_authority),
+        raiseload("*"),
     )
 
     # Apply search filter if provided
     if search:
         stmt = stmt.where(PredefinedFlow.flow_name.ilike(f"%{search}%"))
 
-    # Apply ordering
-    stmt = stmt.order_by(PredefinedFlow.flow_name)
-
-    return paginate_select(db, stmt, pagination)
+    return stmt
 
 
-def create_predefined_flow(
-    db: Session, flow_data: PredefinedFlowCreate
+async def create_predefined_flow(
+    db: AsyncSession, flow_data: PredefinedFlowCreate
 ) -> PredefinedFlow:
     """Create a new predefined flow with stages."""
-    # Check if flow with this name already exists
-    stmt = select(PredefinedFlow).where(PredefinedFlow.flow_name == flow_data.flow_name)
-    existing = db.execute(stmt).scalars().first()
-    if existing:
+    # Insert the flow unless the name is taken, detecting conflicts in one round-trip
+    flow_id = await _insert_flow_if_name_free(db, flow_data.flow_name)
+    if flow_id is None:
         raise PredefinedFlowAlreadyExists(flow_data.flow_name)
 
     # Resolve stage names to IDs and validate they exist
-    resolved_stages = resolve_stage_names_to_ids(db, flow_data.stages)
-
-    # Create the predefined flow
-    db_flow = PredefinedFlow(flow_name=flow_data.flow_name)
-    db.add(db_flow)
-    db.flush()  # Flush to get the ID
+    stage_pairs = await resolve_stage_names_to_ids(db, flow_data.stages)
 
     # Create predefined flow stages with priorities
-    _create_flow_stages(db, db_flow.id, resolved_stages)
+    await _insert_flow_stages(db, flow_id, stage_pairs)
 
-    db.commit()
-    db.refresh(db_flow)
-    return db_flow
+    await db.commit()
+    flows_list_cache.clear()
+    return await get_predefined_flow(db, flow_id)
 
 
-def patch_predefined_flow(
-    db: Session, flow_id: int, flow_update: PredefinedFlowUpdate
+async def patch_predefined_flow(
+    db: AsyncSession, flow_id: int, flow_update: PredefinedFlowUpdate
 ) -> PredefinedFlow:
     """Patch an existing predefined flow."""
+    update_data = flow_update.model_dump(exclude_unset=True)
+    new_flow_name = update_data.get("flow_name")
+
+    # Fetch the flow together with any other flow already using the requested name
+    lookup_filter = PredefinedFlow.id == flow_id
+    if new_flow_name is not None:
+        lookup_filter = or_(lookup_filter, PredefinedFlow.flow_name == new_flow_name)
     stmt = (
         select(PredefinedFlow)
         .options(joinedload(PredefinedFlow.predefined_flow_stages))
-        .where(PredefinedFlow.id == flow_id)
+        .where(lookup_filter)
     )
-    db_flow = db.execute(stmt).scalars().first()
+    flows = (await db.execute(stmt)).unique().scalars().all()
+
+    db_flow = next((flow for flow in flows if flow.id == flow_id), None)
     if not db_flow:
         raise PredefinedFlowNotFound(flow_id)
 
-    update_data = flow_update.model_dump(exclude_unset=True)
-
-    # Check for name conflicts if name is being updated
-    if "flow_name" in update_data and update_data["flow_name"] is not None:
-        stmt = (
-            select(PredefinedFlow)
-            .where(PredefinedFlow.flow_name == update_data["flow_name"])
-            .where(PredefinedFlow.id != flow_id)
-        )
-        existing = db.execute(stmt).scalars().first()
-        if existing:
-            raise PredefinedFlowAlreadyExists(update_data["flow_name"])
+    # Any other flow returned by the lookup already uses the requested name
+    if any(flow.id != flow_id for flow in flows):
+        raise PredefinedFlowAlreadyExists(new_flow_name)
 
     # Update flow name if provided
     if "flow_name" in update_data:
@@ -206,50 +268,102 @@ def patch_predefined_flow(
     # Update stages if provided
     if "stages" in update_data and update_data["stages"] is not None:
         # Resolve stage names to IDs and validate they exist
-        resolved_stages = resolve_stage_names_to_ids(db, update_data["stages"])
+        stage_pairs = await resolve_stage_names_to_ids(db, update_data["stages"])
+
+        # Apply only the stage changes between the current and requested flow
+        await _replace_flow_stages(db, db_flow, stage_pairs)
+
+    await db.commit()
+    flows_list_cache.clear()
+    return await get_predefined_flow(db, flow_id)
 
-        # Delete existing stages
-        for existing_stage in db_flow.predefined_flow_stages:
-            db.delete(existing_stage)
 
-        # Create new stages
-        _create_flow_stages(db, db_flow.id, resolved_stages)
+async def _insert_flow_if_name_free(db: AsyncSession, flow_name: str) -> int | None:
+    """
+    Insert a predefined flow row unless its name is already taken.
+
+    Uses INSERT ... ON CONFLICT DO NOTHING RETURNING id, so the uniqueness
+    check and the insert share a single statement.
 
-    db.commit()
-    db.refresh(db_flow)
-    return db_flow
+    Returns:
+        The new flow ID, or None if a flow with this name already exists
+    """
+    dialect_insert = sqlite_insert if db.bind.dialect.name == "sqlite" else pg_insert
+    stmt = (
+        dialect_insert(PredefinedFlow)
+        .values(flow_name=flow_name)
+        .on_conflict_do_nothing(index_elements=[PredefinedFlow.flow_name])
+        .returning(PredefinedFlow.id)
+    )
+    return (await db.execute(stmt)).scalar_one_or_none()
 
 
-def _create_flow_stages(
-    db: Session, flow_id: int, stages: list[int | list[int]]
+async def _insert_flow_stages(
+    db: AsyncSession, flow_id: int, stage_pairs: list[tuple[int, int]]
 ) -> None:
-    """Create predefined flow stages with priorities using enumerate."""
-    for priority, stage_item in enumerate(stages, start=1):
-        if isinstance(stage_item, list):
-            # Multiple stages with same priority
-            for stage_type_id in stage_item:
-                db_stage = PredefinedFlowStage(
-                    predefined_flow_id=flow_id,
-                    stage_type_id=stage_type_id,
-                    priority=priority,
-                )
-                db.add(db_stage)
+    """Insert (priority, stage_type_id) pairs for a flow in a single statement."""
+    if not stage_pairs:
+        return
+
+    await db.execute(
+        insert(PredefinedFlowStage),
+        [
+            {
+                "predefined_flow_id": flow_id,
+                "stage_type_id": stage_type_id,
+                "priority": priority,
+            }
+            for priority, stage_type_id in stage_pairs
+        ],
+    )
+
+
+async def _replace_flow_stages(
+    db: AsyncSession, db_flow: PredefinedFlow, stage_pairs: list[tuple[int, int]]
+) -> None:
+    """
+    Replace the stages of a flow by applying only the difference.
+
+    Stages whose (priority, stage_type_id) pair is unchanged are kept as-is;
+    stale stages are removed with one DELETE and missing ones are added with
+    one INSERT.
+    """
+    existing_by_key: dict[tuple[int, int], list[PredefinedFlowStage]] = defaultdict(
+        list
+    )
+    for stage in db_flow.predefined_flow_stages:
+        existing_by_key[(stage.priority, stage.stage_type_id)].append(stage)
+
+    stages_to_add = []
+    for key in stage_pairs:
+        if existing_by_key[key]:
+            existing_by_key[key].pop()
         else:
-            # Single stage
-            db_stage = PredefinedFlowStage(
-                predefined_flow_id=flow_id,
-                stage_type_id=stage_item,
-                priority=priority,
+            stages_to_add.append(key)
+
+    stage_ids_to_delete = [
+        stage.id for remaining in existing_by_key.values() for stage in remaining
+    ]
+
+    if stage_ids_to_delete:
+        await db.execute(
+            delete(PredefinedFlowStage).where(
+                PredefinedFlowStage.id.in_(stage_ids_to_delete)
             )
-            db.add(db_stage)
+        )
 
+    await _insert_flow_stages(db, db_flow.id, stages_to_add)
 
-def delete_predefined_flow(db: Session, flow_id: int) -> None:
+
+async def delete_predefined_flow(db: AsyncSession, flow_id: int) -> None:
     """Delete a predefined flow."""
-    stmt = select(PredefinedFlow).where(PredefinedFlow.id == flow_id)
-    db_flow = db.execute(stmt).scalars().first()
+    stmt = lambda_stmt(
+        lambda: select(PredefinedFlow).where(PredefinedFlow.id == flow_id)
+    )
+    db_flow = (await db.execute(stmt)).scalars().first()
     if not db_flow:
         raise PredefinedFlowNotFound(flow_id)
 
-    db.delete(db_flow)
-    db.commit()
+    await db.delete(db_flow)
+    await db.commit()
+    flows_list_cache.clear()
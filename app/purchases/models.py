@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 from sqlalchemy import DateTime, ForeignKey, event, func
 from sqlalchemy.orm import Mapped, mapped_column, object_session, relationship
 
+from app.common.priority_utils import priority_groups
 from app.database import Base
 
 if TYPE_CHECKING:
@@ -28,8 +29,9 @@ class Purchase(Base):
     budget_source_id: Mapped[int | None] = mapped_column(
         ForeignKey("budget_source.id"), nullable=True, index=True
     )
+    # Set by the database only; the value comes back via RETURNING on insert
     creation_date: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.now, server_default=func.now(), nullable=False
+        DateTime, server_default=func.now(), nullable=False
     )
 
     # Relationships
@@ -41,7 +43,10 @@ class Purchase(Base):
         "BudgetSource", back_populates="purchases"
     )
     stages: Mapped[list["Stage"]] = relationship(
-        "Stage", back_populates="purchase", cascade="all, delete-orphan"
+        "Stage",
+        back_populates="purchase",
+        cascade="all, delete-orphan",
+        order_by="[Stage.priority, Stage.id]",
     )
     costs: Mapped[list["Cost"]] = relationship(
         "Cost", back_populates="purchase", cascade="all, delete-orphan"
@@ -61,6 +66,10 @@ class Purchase(Base):
         """
         from app.purposes.pending_authority_utils import get_pending_authority_object
 
+        # Use the value primed by set_pending_authority if present
+        if "_pending_authority_cache" in self.__dict__:
+            return self._pending_authority_cache
+
         # Get the session from the object to execute the query
         session = object_session(self)
         if not session:
@@ -71,26 +80,38 @@ class Purchase(Base):
         )
 
     @property
-    def flow_stages(self) -> list["Stage | list[Stage]"]:
-        """Calculate flow stages grouped by priority."""
-        if not self.stages:
-            return []
-
-        stages_by_priority = {}
-        for stage in self.stages:
-            if stage.priority not in stages_by_priority:
-                stages_by_priority[stage.priority] = []
-            stages_by_priority[stage.priority].append(stage)
-
-        result = []
-        for priority in sorted(stages_by_priority.keys()):
-            priority_stages = stages_by_priority[priority]
-            if len(priority_stages) == 1:
-                result.append(priority_stages[0])
-            else:
-                result.append(priority_stages)
-
-        return result
+    def flow_stages(self) -> list[list["Stage"]]:
+        """
+        Calculate flow stages grouped by priority, one list per priority.
+
+        The grouping is memoized on the instance and reset when the purchase is
+        loaded, refreshed or expired, when stages are added or removed, and
+        when a stage's priority changes.
+        """
+        flow_stages = self.__dict__.get("_flow_stages_cache")
+        if flow_stages is None:
+            # Stages load ordered by priority, so the sort inside is a linear
+            # pass that only guards against in-memory changes made since loading
+            flow_stages = priority_groups(self.stages)
+            self._flow_stages_cache = flow_stages
+        return flow_stages
+
+    def invalidate_flow_stages(self) -> None:
+        """Drop the memoized flow_stages grouping."""
+        self.__dict__.pop("_flow_stages_cache", None)
+
+    def set_pending_authority(self, authority: "ResponsibleAuthority | None") -> None:
+        """
+        Prime pending_authority with a value computed in bulk.
+
+        The primed value is dropped together with the memoized flow stages, so
+        it never outlives the stage state it was computed from.
+        """
+        self._pending_authority_cache = authority
+
+    def invalidate_pending_authority(self) -> None:
+        """Drop the primed pending_authority value."""
+        self.__dict__.pop("_pending_authority_cache", None)
 
     def __repr__(self) -> str:
         return f"<Purchase(id={self.id}, purpose_id={self.purpose_id}, stages={len(self.stages)})>"
@@ -100,9 +121,28 @@ class Purchase(Base):
 @event.listens_for(Purchase, "after_insert")
 @event.listens_for(Purchase, "after_update")
 @event.listens_for(Purchase, "after_delete")
-def _update_purpose_on_purchase_change(_mapper, connection, target: Purchase) -> None:
+def _update_purpose_on_purchase_change(_mapper, _connection, target: Purchase) -> None:
     """Update Purpose.last_modified when Purchase changes."""
     if hasattr(target, "purpose_id") and target.purpose_id:
-        from app.purposes.models import update_purpose_last_modified
+        from app.purposes.models import queue_purpose_last_modified
+
+        queue_purpose_last_modified(target, target.purpose_id)
+
+
+@event.listens_for(Purchase, "load")
+@event.listens_for(Purchase, "refresh")
+@event.listens_for(Purchase, "expire")
+def _reset_flow_stages_on_reload(target: Purchase, *_args) -> None:
+    """Reset memoized stage-derived values whenever the purchase is reloaded."""
+    # Expiry can run after the instance was garbage collected, leaving no target
+    if target is not None:
+        target.invalidate_flow_stages()
+        target.invalidate_pending_authority()
+
 
-        update_purpose_last_modified(connection, target.purpose_id)
+@event.listens_for(Purchase.stages, "append")
+@event.listens_for(Purchase.stages, "remove")
+def _reset_flow_stages_on_stages_change(target: Purchase, _value, _initiator) -> None:
+    """Reset memoized stage-derived values when stages are added or removed."""
+    target.invalidate_flow_stages()
+    target.invalidate_pending_authority()
@@ -1,62 +1,105 @@
 """Purchase API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dependencies import require_admin
 from app.budget_sources.exceptions import BudgetSourceNotFound
-from app.database import get_db
+from app.common.responses import json_response
+from app.database import get_async_db
 from app.purchases import service
 from app.purchases.exceptions import PurchaseNotFound
+from app.purchases.models import Purchase
 from app.purchases.schemas import PurchaseCreate, PurchaseResponse, PurchaseUpdate
 from app.stage_types.exceptions import StageTypeNotFound
 from app.stages.exceptions import StageNotFound
 
 router = APIRouter()
 
+# Computed fields derived from flow_stages that clients can opt out of
+_PENDING_FIELDS = {"current_pending_stages", "days_since_last_completion"}
+
+# Handlers run on an AsyncSession so DB round-trips are awaited instead of holding
+# a threadpool worker. The service layer stays synchronous (stage management and
+# fixtures share it) and runs through run_sync, which executes it in a greenlet
+# on the session's async connection.
+
+
+def _purchase_response(
+    purchase: Purchase,
+    status_code: int = status.HTTP_200_OK,
+    exclude: set[str] | None = None,
+) -> Response:
+    """
+    Serialize a purchase to JSON in one pass, bypassing response_model.
+
+    The response is built from the loaded purchase without re-validation, so
+    its computed fields are evaluated once here.
+    """
+    return json_response(
+        service.purchase_to_response(purchase), status_code, exclude=exclude
+    )
+
 
 @router.post(
     "/",
-    response_model=PurchaseResponse,
+    response_model=None,
     status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_201_CREATED: {"model": PurchaseResponse}},
     dependencies=[Depends(require_admin)],
 )
-def create_purchase(
+async def create_purchase(
     purchase_data: PurchaseCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Create a new purchase."""
     try:
-        return service.create_purchase(db, purchase_data)
+        purchase = await db.run_sync(service.create_purchase, purchase_data)
+        return _purchase_response(purchase, status.HTTP_201_CREATED)
     except BudgetSourceNotFound as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
 
 
-@router.get("/{purchase_id}", response_model=PurchaseResponse)
-def get_purchase(
+@router.get(
+    "/{purchase_id}",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": PurchaseResponse}},
+)
+async def get_purchase(
     purchase_id: int,
-    db: Session = Depends(get_db),
+    include_pending: bool = Query(
+        True,
+        description="Include current_pending_stages and days_since_last_completion",
+    ),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get a purchase by ID."""
     try:
-        return service.get_purchase(db, purchase_id)
+        purchase = await db.run_sync(service.get_purchase, purchase_id)
+        return _purchase_response(
+            purchase, exclude=None if include_pending else _PENDING_FIELDS
+        )
     except PurchaseNotFound as e:
         raise HTTPException(status_code=404, detail=e.message)
 
 
 @router.patch(
     "/{purchase_id}",
-    response_model=PurchaseResponse,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": PurchaseResponse}},
     dependencies=[Depends(require_admin)],
 )
-def patch_purchase(
+async def patch_purchase(
     purchase_id: int,
     purchase_update: PurchaseUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Patch an existing purchase."""
     try:
-        return service.patch_purchase(db, purchase_id, purchase_update)
+        purchase = await db.run_sync(
+            service.patch_purchase, purchase_id, purchase_update
+        )
+        return _purchase_response(purchase)
     except PurchaseNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
     except (BudgetSourceNotFound, StageNotFound, StageTypeNotFound) as e:
@@ -68,12 +111,12 @@ def patch_purchase(
     status_code=status.HTTP_204_NO_CONTENT,
     dependencies=[Depends(require_admin)],
 )
-def delete_purchase(
+async def delete_purchase(
     purchase_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> None:
     """Delete a purchase by ID."""
     try:
-        service.delete_purchase(db, purchase_id)
+        await db.run_sync(service.delete_purchase, purchase_id)
     except PurchaseNotFound as e:
         raise HTTPException(status_code=404, detail=e.message)
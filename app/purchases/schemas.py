@@ -1,20 +1,22 @@
 """Pydantic schemas for purchase data validation."""
 
 from datetime import date, datetime
-from functools import cached_property
-from typing import Annotated
+from typing import Annotated, Any
 
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PrivateAttr,
     computed_field,
+    field_serializer,
     field_validator,
     model_validator,
 )
 from typing_extensions import TypeAlias
 
 from app.budget_sources.schemas import BudgetSource
+from app.common.priority_utils import unwrap_singletons
 from app.costs.schemas import Cost, CostBase
 from app.responsible_authorities.schemas import ResponsibleAuthorityResponse
 from app.stages.schemas import StageResponse
@@ -149,113 +151,124 @@ class PurchaseResponse(PurchaseBase):
     costs: list[Cost] = []
     budget_source: BudgetSource | None = None
     pending_authority: ResponsibleAuthorityResponse | None = None
-    flow_stages: list[StageResponse | list[StageResponse]] = []
+    # Validated as uniform groups so traversals need no per-element type checks;
+    # the serializer restores the public format where singleton groups are unwrapped
+    flow_stages: list[list[StageResponse]] = []
+
+    # Latest completion date per priority, built once during validation and
+    # reused by days_since_last_completion
+    _reference_dates: dict[int, date] = PrivateAttr(default_factory=dict)
+    # Filled by the validator walk, or lazily by current_pending_stages; a private
+    # attribute rather than a cached_property so it stays out of the field __dict__
+    _pending_stages: list[StageResponse] | None = PrivateAttr(default=None)
+
+    @field_validator("flow_stages", mode="before")
+    @classmethod
+    def group_singleton_stages(cls, flow_stages: Any) -> Any:
+        """Accept the public nested format by wrapping singletons in a group."""
+        if not isinstance(flow_stages, list):
+            return flow_stages
+        return [
+            stages if isinstance(stages, list) else [stages] for stages in flow_stages
+        ]
 
-    @field_validator("flow_stages", mode="after")
-    def calculate_days_since_previous_stage(
-        cls, flow_stages: list[StageResponse | list[StageResponse]], info
+    @field_serializer("flow_stages")
+    def serialize_flow_stages(
+        self, flow_stages: list[list[StageResponse]]
     ) -> list[StageResponse | list[StageResponse]]:
+        return unwrap_singletons(flow_stages)
+
+    @model_validator(mode="after")
+    def calculate_days_since_previous_stage(self) -> "PurchaseResponse":
         """Calculate days_since_previous_stage for each stage."""
-        if not flow_stages or not info.data:
-            return flow_stages
+        # With a single priority level there is no previous level to measure
+        # from, so every value stays None
+        if len(self.flow_stages) < 2:
+            return self
 
-        # Process each priority level
+        # Build the priority -> reference date map once, then look up per stage
+        self._reference_dates = self._get_reference_dates(self.flow_stages)
         current_date = datetime.now().date()
-        for stages in flow_stages:
-            if isinstance(stages, list):
-                # Multiple stages at this priority
-                for stage in stages:
-                    target_date = stage.completion_date or current_date
-                    days_since_previous = cls._get_days_since_reference(
-                        stage.priority, flow_stages, target_date
-                    )
-                    stage.days_since_previous_stage = days_since_previous
-            else:
-                # Single stage at this priority
-                target_date = stages.completion_date or current_date
-                days_since_previous = cls._get_days_since_reference(
-                    stages.priority, flow_stages, target_date
+        pending_stages: list[StageResponse] = []
+        for stages in self.flow_stages:
+            for stage in stages:
+                target_date = stage.completion_date or current_date
+                stage.days_since_previous_stage = self._get_days_since_reference(
+                    stage.priority, self._reference_dates, target_date
                 )
-                stages.days_since_previous_stage = days_since_previous
+            # The same walk finds the first level with incomplete stages, so
+            # current_pending_stages does not have to scan again
+            if not pending_stages:
+                pending_stages = [
+                    stage for stage in stages if stage.completion_date is None
+                ]
+
+        self._pending_stages = pending_stages
+        return self
 
-        return flow_stages
+    @staticmethod
+    def _get_reference_dates(
+        all_flow_stages: list[list[StageResponse]],
+    ) -> dict[int, date]:
+        """
+        Map each priority to the most recent completion date among its stages.
+
+        Priorities without a completed stage are absent from the result.
+        """
+        reference_dates: dict[int, date] = {}
+        for stages in all_flow_stages:
+            for stage in stages:
+                if stage.completion_date is None:
+                    continue
+                latest = reference_dates.get(stage.priority)
+                if latest is None or stage.completion_date > latest:
+                    reference_dates[stage.priority] = stage.completion_date
+        return reference_dates
 
     @classmethod
     def _get_days_since_reference(
         cls,
         priority: int,
-        all_flow_stages: list,
-        target_date: date | None = None,
+        reference_dates: dict[int, date],
+        target_date: date,
     ) -> int | None:
         """
         Unified helper method to calculate days since reference date.
 
         Args:
             priority: Priority level to calculate for
-            all_flow_stages: All flow stages for reference lookup
-            target_date: Target date to calculate to (defaults to current date)
+            reference_dates: Latest completion date per priority, from
+                _get_reference_dates
+            target_date: Target date to calculate to
 
         Returns:
             Days elapsed from reference to target date, or None if no reference found
         """
-        if target_date is None:
-            target_date = datetime.now().date()
-
         # For priority 1 stages, always return None
         if priority == 1:
             return None
-        else:
-            # Find the most recent completion date from previous priority level
-            previous_priority = priority - 1
-            reference_date = None
-
-            # Look through all_flow_stages to find previous priority stages
-            for stages in all_flow_stages:
-                if isinstance(stages, list):
-                    # Multiple stages at this priority
-                    if stages and stages[0].priority == previous_priority:
-                        completed_stages = [
-                            s for s in stages if s.completion_date is not None
-                        ]
-                        if completed_stages:
-                            reference_date = max(
-                                s.completion_date for s in completed_stages
-                            )
-                        break
-                else:
-                    # Single stage at this priority
-                    if (
-                        stages.priority == previous_priority
-                        and stages.completion_date is not None
-                    ):
-                        reference_date = stages.completion_date
-                        break
-
-            if reference_date is None:
-                return None
+
+        # The reference is the most recent completion at the previous priority level
+        reference_date = reference_dates.get(priority - 1)
+        if reference_date is None:
+            return None
 
         return (target_date - reference_date).days
 
     @computed_field
-    @cached_property
+    @property
     def current_pending_stages(self) -> list[StageResponse]:
         """Get stages in the current incomplete priority level."""
-        if not self.flow_stages:
-            return []
+        if self._pending_stages is None:
+            self._pending_stages = self._find_current_pending_stages()
+        return self._pending_stages
 
-        # Find the (first) priority level with incomplete stages
+    def _find_current_pending_stages(self) -> list[StageResponse]:
+        """Scan flow_stages for the first priority level with incomplete stages."""
         for stages in self.flow_stages:
-            if isinstance(stages, list):
-                # If multiple stages at this priority, check if any is incomplete
-                incomplete_stages = [
-                    stage for stage in stages if stage.completion_date is None
-                ]
-                if incomplete_stages:
-                    return incomplete_stages
-            else:
-                # Single stage at this priority
-                if stages.completion_date is None:
-                    return [stages]
+            # Only build the list for the level that has incomplete stages
+            if any(stage.completion_date is None for stage in stages):
+                return [stage for stage in stages if stage.completion_date is None]
 
         return []
 
@@ -272,9 +285,9 @@ class PurchaseResponse(PurchaseBase):
 
         current_pending_priority = current_pending_stages[0].priority
 
-        # Use the unified method to calculate days since reference
+        # Reuse the reference dates computed during validation
         return self._get_days_since_reference(
-            current_pending_priority, self.flow_stages
+            current_pending_priority, self._reference_dates, datetime.now().date()
         )
 
     model_config = ConfigDict(from_attributes=True)
@@ -1,19 +1,28 @@
 """Service layer for purchase operations."""
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app import CurrencyEnum
 from app.budget_sources.exceptions import BudgetSourceNotFound
 from app.budget_sources.models import BudgetSource
+from app.budget_sources.schemas import BudgetSource as BudgetSourceResponse
+from app.common.priority_utils import priority_groups
 from app.costs.models import Cost
+from app.costs.schemas import Cost as CostResponse
 from app.predefined_flows import service as predefined_flow_service
 from app.purchases.consts import PredefinedFlowName
 from app.purchases.exceptions import PurchaseNotFound
 from app.purchases.models import Purchase
-from app.purchases.schemas import PurchaseCreate, PurchaseUpdate
+from app.purchases.schemas import PurchaseCreate, PurchaseResponse, PurchaseUpdate
+from app.purposes.models import update_purpose_last_modified
+from app.purposes.pending_authority_utils import get_purchase_pending_authority_id_query
+from app.responsible_authorities.models import ResponsibleAuthority
+from app.responsible_authorities.schemas import ResponsibleAuthorityResponse
+from app.stage_types.schemas import StageTypeResponse
 from app.stages import service as stage_service
 from app.stages.models import Stage
+from app.stages.schemas import StageResponse
 
 
 def _validate_budget_source_exists(db: Session, budget_source_id: int | None) -> None:
@@ -32,63 +41,118 @@ def create_purchase(db: Session, purchase_data: PurchaseCreate) -> Purchase:
     # Validate budget source if provided
     _validate_budget_source_exists(db, purchase_data.budget_source_id)
 
-    # Extract costs data before creating purchase
-    costs_data = purchase_data.costs
+    # Attach costs through the relationship so one flush writes the purchase and
+    # then all of its costs as a single batched INSERT
     purchase_dict = purchase_data.model_dump(exclude={"costs"})
-
-    db_purchase = Purchase(**purchase_dict)
+    db_purchase = Purchase(
+        **purchase_dict,
+        costs=[
+            Cost(currency=cost_data.currency, amount=cost_data.amount)
+            for cost_data in purchase_data.costs
+        ],
+    )
     db.add(db_purchase)
     db.flush()  # Get the purchase ID
 
-    # Create costs
-    costs = [
-        Cost(
-            purchase_id=db_purchase.id,
-            currency=cost_data.currency,
-            amount=cost_data.amount,
-        )
-        for cost_data in costs_data
-    ]
-    db.add_all(costs)
-    db_purchase.costs = costs
-
     # Get and store the predefined flow based on costs
     flow_name_enum = get_predefined_flow_for_purchase(db_purchase)
     if flow_name_enum is not None:
-        predefined_flow = predefined_flow_service.get_predefined_flow_by_name(
+        flow_id, stage_pairs = predefined_flow_service.get_flow_stage_pairs_by_name(
             db, flow_name_enum.value
         )
-        db_purchase.predefined_flow_id = predefined_flow.id
+        db_purchase.predefined_flow_id = flow_id
 
         # Create stages based on predefined flow
-        stage_service.create_stages_from_flow(db, db_purchase.id, predefined_flow)
+        stage_service.create_stages_from_flow(db, db_purchase.id, stage_pairs)
 
     db.commit()
-    db.refresh(db_purchase)
 
-    return db_purchase
+    # Reload with eager loads for the response instead of lazy loading on access
+    return get_purchase(db, db_purchase.id)
 
 
 def get_purchase(db: Session, purchase_id: int) -> Purchase:
-    """Get a purchase by ID with eager loaded stages and stage types."""
+    """
+    Get a purchase by ID with the relationships PurchaseResponse reads.
+
+    The pending authority is joined onto the purchase row through a correlated
+    subquery, collections use selectinload (one IN query each) and
+    budget_source a join, so serializing the purchase issues no further
+    queries (required when it is serialized outside an async session).
+    """
+    pending_authority_id = get_purchase_pending_authority_id_query(Purchase.id)
     stmt = (
-        select(Purchase)
+        select(Purchase, ResponsibleAuthority)
+        .outerjoin(
+            ResponsibleAuthority, ResponsibleAuthority.id == pending_authority_id
+        )
         .options(
-            joinedload(Purchase.stages).joinedload(Stage.stage_type),
-            joinedload(Purchase.predefined_flow),
-            joinedload(Purchase.costs),
+            selectinload(Purchase.stages).joinedload(Stage.stage_type),
+            selectinload(Purchase.costs),
             joinedload(Purchase.budget_source),
         )
         .where(Purchase.id == purchase_id)
     )
-    purchase = db.execute(stmt).unique().scalar_one_or_none()
+    row = db.execute(stmt).first()
 
-    if not purchase:
+    if not row:
         raise PurchaseNotFound(purchase_id)
 
+    purchase, pending_authority = row
+    purchase.set_pending_authority(pending_authority)
     return purchase
 
 
+def purchase_to_response(purchase: Purchase) -> PurchaseResponse:
+    """
+    Build a PurchaseResponse from a purchase loaded by get_purchase.
+
+    The purchase and its stages come straight from the database, so they are
+    built with model_construct instead of being validated field by field. Each
+    stage type is validated once and shared by the stages using it. The
+    days-since calculation that validation would have run is applied here.
+    """
+    stage_types: dict[int, StageTypeResponse] = {}
+
+    def to_stage_response(stage: Stage) -> StageResponse:
+        stage_type = stage_types.get(stage.stage_type_id)
+        if stage_type is None:
+            stage_type = StageTypeResponse.model_validate(stage.stage_type)
+            stage_types[stage.stage_type_id] = stage_type
+        return StageResponse.model_construct(
+            id=stage.id,
+            purchase_id=stage.purchase_id,
+            stage_type_id=stage.stage_type_id,
+            priority=stage.priority,
+            value=stage.value,
+            completion_date=stage.completion_date,
+            note=stage.note,
+            custom_name=stage.custom_name,
+            stage_type=stage_type,
+        )
+
+    pending_authority = purchase.pending_authority
+    response = PurchaseResponse.model_construct(
+        id=purchase.id,
+        purpose_id=purchase.purpose_id,
+        budget_source_id=purchase.budget_source_id,
+        creation_date=purchase.creation_date,
+        costs=[CostResponse.model_validate(cost) for cost in purchase.costs],
+        budget_source=(
+            BudgetSourceResponse.model_validate(purchase.budget_source)
+            if purchase.budget_source
+            else None
+        ),
+        pending_authority=(
+            ResponsibleAuthorityResponse.model_validate(pending_authority)
+            if pending_authority
+            else None
+        ),
+        flow_stages=priority_groups(purchase.stages, value=to_stage_response),
+    )
+    return response.calculate_days_since_previous_stage()
+
+
 def patch_purchase(
     db: Session, purchase_id: int, purchase_update: PurchaseUpdate
 ) -> Purchase:
@@ -118,39 +182,58 @@ def patch_purchase(
         stage_service.create_stages_from_edits(db, purchase_id, stages_update)
 
     db.commit()
-    db.refresh(db_purchase)
-    return db_purchase
+    return get_purchase(db, purchase_id)
 
 
 def delete_purchase(db: Session, purchase_id: int) -> None:
-    """Delete a purchase by ID."""
-    purchase = get_purchase(db, purchase_id)
-    db.delete(purchase)
-    db.commit()
-
+    """
+    Delete a purchase and its stages and costs by ID.
+
+    Issued as point DELETEs instead of loading the purchase for an ORM delete.
+    The stage and cost foreign keys have no ON DELETE CASCADE, so the children
+    are removed first; the purpose's last_modified is bumped explicitly since no
+    flush (and so no mapper event) is involved.
+    """
+    db.execute(delete(Stage).where(Stage.purchase_id == purchase_id))
+    db.execute(delete(Cost).where(Cost.purchase_id == purchase_id))
+    purpose_id = db.execute(
+        delete(Purchase)
+        .where(Purchase.id == purchase_id)
+        .returning(Purchase.purpose_id)
+    ).scalar_one_or_none()
 
-def get_predefined_flow_for_purchase(purchase: Purchase) -> PredefinedFlowName | None:
-    """Return predefined flow based on purchase attributes (fake logic for now)."""
+    if purpose_id is None:
+        db.rollback()
+        raise PurchaseNotFound(purchase_id)
 
-    if not purchase.costs:
-        return None
+    update_purpose_last_modified(db.connection(), purpose_id)
+    db.commit()
 
-    is_amount_above_400k = sum(cost.amount for cost in purchase.costs) >= 400_000
 
-    if len(purchase.costs) > 1:
-        if is_amount_above_400k:
-            return PredefinedFlowName.MIXED_USD_ABOVE_400K_FLOW
-        else:
-            return PredefinedFlowName.MIXED_USD_FLOW
+# Predefined flow by (has several costs, currency of the single cost, total is
+# at least 400k). Combinations missing from the table use the ILS flow.
+_FLOW_TABLE: dict[tuple[bool, CurrencyEnum | None, bool], PredefinedFlowName] = {
+    (True, None, True): PredefinedFlowName.MIXED_USD_ABOVE_400K_FLOW,
+    (True, None, False): PredefinedFlowName.MIXED_USD_FLOW,
+    (False, CurrencyEnum.SUPPORT_USD, True): (
+        PredefinedFlowName.SUPPORT_USD_ABOVE_400K_FLOW
+    ),
+    (False, CurrencyEnum.SUPPORT_USD, False): PredefinedFlowName.SUPPORT_USD_FLOW,
+    (False, CurrencyEnum.AVAILABLE_USD, True): PredefinedFlowName.AVAILABLE_USD_FLOW,
+    (False, CurrencyEnum.AVAILABLE_USD, False): PredefinedFlowName.AVAILABLE_USD_FLOW,
+}
 
-    cost = purchase.costs[0]
 
-    if cost.currency == CurrencyEnum.SUPPORT_USD:
-        if is_amount_above_400k:
-            return PredefinedFlowName.SUPPORT_USD_ABOVE_400K_FLOW
-        return PredefinedFlowName.SUPPORT_USD_FLOW
+def get_predefined_flow_for_purchase(purchase: Purchase) -> PredefinedFlowName | None:
+    """Return predefined flow based on purchase attributes (fake logic for now)."""
+    costs = purchase.costs
+    if not costs:
+        return None
 
-    elif cost.currency == CurrencyEnum.AVAILABLE_USD:
-        return PredefinedFlowName.AVAILABLE_USD_FLOW
+    is_mixed = len(costs) > 1
+    currency = None if is_mixed else costs[0].currency
+    is_amount_above_400k = sum(cost.amount for cost in costs) >= 400_000
 
-    return PredefinedFlowName.ILS_FLOW
+    return _FLOW_TABLE.get(
+        (is_mixed, currency, is_amount_above_400k), PredefinedFlowName.ILS_FLOW
+    )
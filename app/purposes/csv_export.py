@@ -1,15 +1,26 @@
 import csv
-import io
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from datetime import date
+from itertools import islice
 
-from sqlalchemy import desc
-from sqlalchemy.orm import Session
+from sqlalchemy import Connection, Engine, Row, Select, func, select
+from sqlalchemy.orm import Session, aliased
 
 from app import Purchase
-from app.purchases.schemas import PurchaseResponse
+from app.common.priority_utils import priority_groups
+from app.files.models import FileAttachment, purpose_file_attachment
+from app.hierarchies.models import Hierarchy
 from app.purposes.filters import apply_filters
 from app.purposes.models import Purpose, PurposeContent
 from app.purposes.schemas import GetPurposesRequest
-from app.purposes.service import build_search_filter, get_base_purpose_select
+from app.purposes.service import build_search_filter
+from app.purposes.sorting import apply_sorting
+from app.service_types.models import ServiceType
+from app.services.models import Service
+from app.stage_types.models import StageType
+from app.stages.models import Stage
+from app.suppliers.models import Supplier
 
 # Stage type name constants
 EMF_ID_STAGE_NAME = "emf_id"
@@ -17,10 +28,143 @@ BIKUSHIT_ID_STAGE_NAME = "bikushit_id"
 DEMAND_ID_STAGE_NAME = "demand_id"
 ORDER_ID_STAGE_NAME = "order_id"
 
+# Stage type name -> (ID key, completion date key) in the per-purchase stage data
+_STAGE_DATA_KEYS_BY_NAME = {
+    EMF_ID_STAGE_NAME: ("emf_id", "emf_completion_date"),
+    BIKUSHIT_ID_STAGE_NAME: ("bikushit_id", "bikushit_completion_date"),
+    DEMAND_ID_STAGE_NAME: ("demand_id", "demand_completion_date"),
+    ORDER_ID_STAGE_NAME: ("order_id", "order_completion_date"),
+}
+_STAGE_DATA_KEYS = tuple(
+    key for keys in _STAGE_DATA_KEYS_BY_NAME.values() for key in keys
+)
 
-def get_purposes_for_export(db: Session, params: GetPurposesRequest) -> list[Purpose]:
-    """Get all purposes for CSV export with proper filtering and sorting."""
-    stmt = get_base_purpose_select()
+# Purposes fetched per round-trip while streaming an export
+EXPORT_BATCH_SIZE = 500
+
+# CSV rows written per writerows call and streamed as one response chunk
+CSV_ROWS_PER_CHUNK = 100
+
+
+def get_export_purpose_select() -> Select:
+    """
+    Select the purpose-level columns of a CSV row as plain rows.
+
+    Hierarchy path, supplier and service type names are outer joined in, and
+    file attachment names are joined into one newline-separated column by the
+    database, so no ORM objects are built. The joined tables are aliased so
+    filters can still join their own. Contents and purchases are loaded per
+    batch by get_export_contents and get_export_purchase_stages.
+    """
+    hierarchy = aliased(Hierarchy)
+    supplier = aliased(Supplier)
+    service_type = aliased(ServiceType)
+    file_attachment_names = (
+        select(func.aggregate_strings(FileAttachment.original_filename, "\n"))
+        .join(
+            purpose_file_attachment,
+            purpose_file_attachment.c.file_attachment_id == FileAttachment.id,
+        )
+        .where(purpose_file_attachment.c.purpose_id == Purpose.id)
+        .correlate(Purpose)
+        .scalar_subquery()
+    )
+    return (
+        select(
+            Purpose.id,
+            Purpose.description,
+            Purpose.status,
+            Purpose.creation_time,
+            Purpose.last_modified,
+            Purpose.expected_delivery,
+            Purpose.comments,
+            hierarchy.path.label("hierarchy_path"),
+            supplier.name.label("supplier"),
+            service_type.name.label("service_type"),
+            file_attachment_names.label("file_attachment_names"),
+        )
+        .select_from(Purpose)
+        .outerjoin(hierarchy, hierarchy.id == Purpose.hierarchy_id)
+        .outerjoin(supplier, supplier.id == Purpose.supplier_id)
+        .outerjoin(service_type, service_type.id == Purpose.service_type_id)
+    )
+
+
+def get_export_contents(db: Session, purpose_ids: list[int]) -> dict[int, list[Row]]:
+    """
+    Load the (quantity, service_name) contents of the given purposes.
+
+    Returns:
+        Purpose ID -> its contents in ID order
+    """
+    stmt = (
+        select(
+            PurposeContent.purpose_id,
+            PurposeContent.quantity,
+            Service.name.label("service_name"),
+        )
+        .join(Service, Service.id == PurposeContent.service_id)
+        .where(PurposeContent.purpose_id.in_(purpose_ids))
+        .order_by(PurposeContent.id)
+    )
+
+    contents_by_purpose: dict[int, list[Row]] = defaultdict(list)
+    for row in db.execute(stmt):
+        contents_by_purpose[row.purpose_id].append(row)
+    return contents_by_purpose
+
+
+def get_export_purchase_stages(
+    db: Session, purpose_ids: list[int]
+) -> dict[int, dict[int, list[Row]]]:
+    """
+    Load the purchases of the given purposes with the stage columns exported.
+
+    Stages are fetched as plain (priority, stage_type_name, value,
+    completion_date) rows in one query, rather than as Purchase, Stage and
+    StageType objects.
+
+    Returns:
+        Purpose ID -> purchase ID -> the purchase's stages in priority order.
+        Purchases are in ID order; a purchase without stages maps to [].
+    """
+    stmt = (
+        select(
+            Purchase.purpose_id,
+            Purchase.id.label("purchase_id"),
+            Stage.priority,
+            StageType.name.label("stage_type_name"),
+            Stage.value,
+            Stage.completion_date,
+        )
+        .outerjoin(Stage, Stage.purchase_id == Purchase.id)
+        .outerjoin(StageType, StageType.id == Stage.stage_type_id)
+        .where(Purchase.purpose_id.in_(purpose_ids))
+        .order_by(Purchase.id, Stage.priority, Stage.id)
+    )
+
+    purchases_by_purpose: dict[int, dict[int, list[Row]]] = defaultdict(dict)
+    for row in db.execute(stmt):
+        stages = purchases_by_purpose[row.purpose_id].setdefault(row.purchase_id, [])
+        # The outer join yields one stage-less row for purchases without stages
+        if row.priority is not None:
+            stages.append(row)
+    return purchases_by_purpose
+
+
+def iter_purposes_for_export(
+    db: Session, params: GetPurposesRequest
+) -> Iterator[tuple[Row, list[Row], dict[int, list[Row]]]]:
+    """
+    Yield all purposes for CSV export with proper filtering and sorting.
+
+    Each purpose row from get_export_purpose_select comes with its contents and
+    its purchases' stages. Rows are streamed from the database in batches of
+    EXPORT_BATCH_SIZE, and contents and stages are loaded with one query each
+    per batch, so memory stays bounded by one batch rather than the whole
+    export.
+    """
+    stmt = get_export_purpose_select()
 
     # Apply universal filters using the centralized filtering method
     stmt = apply_filters(stmt, params, db)
@@ -30,15 +174,21 @@ def get_purposes_for_export(db: Session, params: GetPurposesRequest) -> list[Pur
         search_filter = build_search_filter(params.search)
         stmt = stmt.where(search_filter)
 
-    # Apply sorting
-    sort_column = getattr(Purpose, params.sort_by, Purpose.creation_time)
-    if params.sort_order == "desc":
-        stmt = stmt.order_by(desc(sort_column))
-    else:
-        stmt = stmt.order_by(sort_column)
+    # Apply sorting, shared with the purpose list
+    stmt = apply_sorting(stmt, params.sort_by, params.sort_order)
 
-    # Execute query without pagination to get all results
-    return list(db.execute(stmt).unique().scalars().all())
+    # Execute query without pagination, streaming results batch by batch
+    stmt = stmt.execution_options(yield_per=EXPORT_BATCH_SIZE)
+    for purposes in db.execute(stmt).partitions():
+        purpose_ids = [purpose.id for purpose in purposes]
+        contents_by_purpose = get_export_contents(db, purpose_ids)
+        purchases_by_purpose = get_export_purchase_stages(db, purpose_ids)
+        for purpose in purposes:
+            yield (
+                purpose,
+                contents_by_purpose[purpose.id],
+                purchases_by_purpose[purpose.id],
+            )
 
 
 def get_csv_headers() -> list[str]:
@@ -69,223 +219,171 @@ def get_csv_headers() -> list[str]:
     ]
 
 
-def extract_purchase_stage_data(purchase: Purchase) -> dict[str, str]:
-    """Extract stage IDs and completion dates from a single purchase."""
-    # Create a dictionary for quick stage lookup by stage type name
-    stage_dict = {
-        stage.stage_type.name: stage
-        for stage in purchase.stages
-        if stage.value  # Only include stages with values
-    }
-
-    emf_stage = stage_dict.get(EMF_ID_STAGE_NAME)
-    bikushit_stage = stage_dict.get(BIKUSHIT_ID_STAGE_NAME)
-    demand_stage = stage_dict.get(DEMAND_ID_STAGE_NAME)
-    order_stage = stage_dict.get(ORDER_ID_STAGE_NAME)
-
-    return {
-        "emf_id": emf_stage.value or "" if emf_stage else "",
-        "emf_completion_date": (
-            emf_stage.completion_date.isoformat()
-            if emf_stage and emf_stage.completion_date
-            else ""
-        ),
-        "bikushit_id": bikushit_stage.value or "" if bikushit_stage else "",
-        "bikushit_completion_date": (
-            bikushit_stage.completion_date.isoformat()
-            if bikushit_stage and bikushit_stage.completion_date
-            else ""
-        ),
-        "demand_id": demand_stage.value or "" if demand_stage else "",
-        "demand_completion_date": (
-            demand_stage.completion_date.isoformat()
-            if demand_stage and demand_stage.completion_date
-            else ""
-        ),
-        "order_id": order_stage.value or "" if order_stage else "",
-        "order_completion_date": (
-            order_stage.completion_date.isoformat()
-            if order_stage and order_stage.completion_date
-            else ""
-        ),
-    }
-
-
-def format_purchase_stages_for_csv(purposes: list[Purpose]) -> dict[int, dict]:
-    """Format all stage data for all purchases organized by purpose_id."""
-    stage_data = {}
-
-    for purpose in purposes:
-        # Extract IDs and completion dates from purchases stages, maintaining purchase order and relationship
-        emf_ids = []
-        emf_completion_dates = []
-        bikushit_ids = []
-        bikushit_completion_dates = []
-        demand_ids = []
-        demand_completion_dates = []
-        order_ids = []
-        order_completion_dates = []
-
-        # Process purchases in order to maintain relationships between IDs and completion dates
-        for purchase in purpose.purchases:
-            purchase_stage_data = extract_purchase_stage_data(purchase)
-
-            # Only add entries if at least one ID exists for this purchase
-            if any(
-                [
-                    purchase_stage_data["emf_id"],
-                    purchase_stage_data["bikushit_id"],
-                    purchase_stage_data["demand_id"],
-                    purchase_stage_data["order_id"],
-                ]
-            ):
-                emf_ids.append(purchase_stage_data["emf_id"])
-                emf_completion_dates.append(purchase_stage_data["emf_completion_date"])
-                bikushit_ids.append(purchase_stage_data["bikushit_id"])
-                bikushit_completion_dates.append(
-                    purchase_stage_data["bikushit_completion_date"]
-                )
-                demand_ids.append(purchase_stage_data["demand_id"])
-                demand_completion_dates.append(
-                    purchase_stage_data["demand_completion_date"]
-                )
-                order_ids.append(purchase_stage_data["order_id"])
-                order_completion_dates.append(
-                    purchase_stage_data["order_completion_date"]
-                )
-
-        # Join IDs and completion dates with newlines (each on its own line, maintaining purchase order)
-        stage_data[purpose.id] = {
-            "emf_ids_str": "\n".join(emf_ids),
-            "emf_completion_dates_str": "\n".join(emf_completion_dates),
-            "bikushit_ids_str": "\n".join(bikushit_ids),
-            "bikushit_completion_dates_str": "\n".join(bikushit_completion_dates),
-            "demand_ids_str": "\n".join(demand_ids),
-            "demand_completion_dates_str": "\n".join(demand_completion_dates),
-            "order_ids_str": "\n".join(order_ids),
-            "order_completion_dates_str": "\n".join(order_completion_dates),
-        }
-
+def extract_purchase_stage_data(stages: list[Row]) -> dict[str, str]:
+    """Extract stage IDs and completion dates from a single purchase's stages."""
+    stage_data = dict.fromkeys(_STAGE_DATA_KEYS, "")
+    for stage in stages:
+        # Only include stages with values; the last matching stage wins
+        keys = _STAGE_DATA_KEYS_BY_NAME.get(stage.stage_type_name)
+        if keys is None or not stage.value:
+            continue
+        id_key, completion_date_key = keys
+        stage_data[id_key] = stage.value
+        completion_date = stage.completion_date
+        stage_data[completion_date_key] = (
+            completion_date.isoformat() if completion_date else ""
+        )
     return stage_data
 
 
-def calculate_pending_stages_info(purchase: Purchase) -> str:
-    """Calculate pending stages string for a purchase."""
-    # Use existing computed fields from Purchase model properties
-    purchase_response = PurchaseResponse.model_validate(purchase)
+def calculate_pending_stages_info(stages: list[Row], today: date) -> str:
+    """
+    Calculate pending stages string for a purchase from its stages.
 
-    current_pending_stages = purchase_response.current_pending_stages
-    days_since_last_completion = purchase_response.days_since_last_completion
+    Applies the same rules as PurchaseResponse's current_pending_stages and
+    days_since_last_completion fields without building the response.
+    """
+    # The first priority level with incomplete stages holds the pending stages
+    current_pending_stages: list[Row] = []
+    for level in priority_groups(stages):
+        current_pending_stages = [
+            stage for stage in level if stage.completion_date is None
+        ]
+        if current_pending_stages:
+            break
+
+    if not current_pending_stages:
+        return ""
 
-    if not current_pending_stages or days_since_last_completion is None:
+    # Days are counted from the latest completion at the previous priority level
+    previous_priority = current_pending_stages[0].priority - 1
+    completion_dates = [
+        stage.completion_date
+        for stage in stages
+        if stage.priority == previous_priority and stage.completion_date is not None
+    ]
+    if not completion_dates:
         return ""
+    days_since_last_completion = (today - max(completion_dates)).days
 
     # Format pending stages names
-    pending_stage_names = [stage.stage_type.name for stage in current_pending_stages]
+    pending_stage_names = [stage.stage_type_name for stage in current_pending_stages]
     return f"{days_since_last_completion} days in {', '.join(pending_stage_names)}"
 
 
-def format_services_list(purpose_contents: list[PurposeContent]) -> str:
-    """Format purpose contents into services string."""
-    return "\n".join(
-        [f"{content.quantity} {content.service_name}" for content in purpose_contents]
-    )
-
-
-def get_file_attachments_info(purpose: Purpose) -> str:
-    """Get file attachment names for a purpose."""
-    return "\n".join([file.original_filename for file in purpose.file_attachments])
-
-
 def build_csv_row_for_purpose(
-    purpose: Purpose, stage_data: dict, pending_stages_data: dict
-) -> list[str]:
-    """Build a single CSV row for a purpose."""
-    # Get purchase IDs (each on its own line)
-    purchase_ids = [str(purchase.id) for purchase in purpose.purchases]
-    purchase_ids_str = "\n".join(purchase_ids)
-
-    # Get pre-calculated data
-    purpose_stage_data = stage_data.get(purpose.id, {})
-    pending_stages_str = pending_stages_data.get(purpose.id, "")
-
-    # Format other data
-    services = format_services_list(purpose.contents)
-    file_attachments = get_file_attachments_info(purpose)
+    purpose: Row,
+    contents: list[Row],
+    purchase_stages: dict[int, list[Row]],
+    today: date,
+) -> tuple[str, ...]:
+    """
+    Build a single CSV row for a purpose.
 
-    return [
+    Args:
+        purpose: Purpose row from get_export_purpose_select
+        contents: The purpose's contents, from get_export_contents
+        purchase_stages: Purchase ID -> stages, from get_export_purchase_stages
+        today: Date pending stage days are counted to
+    """
+    # One pass over the purchases collects every purchase-derived column. Stage
+    # columns get one value per stage data key, in purchase order so IDs and
+    # completion dates stay aligned line by line
+    purchase_ids: list[str] = []
+    pending_stages: list[str] = []
+    stage_columns: dict[str, list[str]] = {key: [] for key in _STAGE_DATA_KEYS}
+    for purchase_id, stages in purchase_stages.items():
+        purchase_ids.append(str(purchase_id))
+        pending_stages.append(calculate_pending_stages_info(stages, today))
+
+        # Only add stage entries if at least one ID exists for this purchase
+        purchase_stage_data = extract_purchase_stage_data(stages)
+        if (
+            purchase_stage_data["emf_id"]
+            or purchase_stage_data["bikushit_id"]
+            or purchase_stage_data["demand_id"]
+            or purchase_stage_data["order_id"]
+        ):
+            for key, value in purchase_stage_data.items():
+                stage_columns[key].append(value)
+
+    # Multi-valued columns hold one value per line
+    status = purpose.status
+    creation_time = purpose.creation_time
+    last_modified = purpose.last_modified
+    expected_delivery = purpose.expected_delivery
+
+    return (
         str(purpose.id),
         purpose.description or "",
-        purpose.status.value if purpose.status else "",
-        purpose.creation_time.isoformat() if purpose.creation_time else "",
-        purpose.last_modified.isoformat() if purpose.last_modified else "",
-        purpose.expected_delivery.isoformat() if purpose.expected_delivery else "",
+        status.value if status else "",
+        creation_time.isoformat() if creation_time else "",
+        last_modified.isoformat() if last_modified else "",
+        expected_delivery.isoformat() if expected_delivery else "",
         purpose.comments or "",
-        purpose.hierarchy.path if purpose.hierarchy else "",
+        purpose.hierarchy_path or "",
         purpose.supplier or "",
         purpose.service_type or "",
-        services,
-        purchase_ids_str,
-        purpose_stage_data.get("emf_ids_str", ""),
-        purpose_stage_data.get("emf_completion_dates_str", ""),
-        purpose_stage_data.get("bikushit_ids_str", ""),
-        purpose_stage_data.get("bikushit_completion_dates_str", ""),
-        purpose_stage_data.get("demand_ids_str", ""),
-        purpose_stage_data.get("demand_completion_dates_str", ""),
-        purpose_stage_data.get("order_ids_str", ""),
-        purpose_stage_data.get("order_completion_dates_str", ""),
-        pending_stages_str,
-        file_attachments,
-    ]
+        "\n".join(
+            [f"{content.quantity} {content.service_name}" for content in contents]
+        ),
+        "\n".join(purchase_ids),
+        # Columns follow _STAGE_DATA_KEYS: ID then completion date per stage name
+        *["\n".join(values) for values in stage_columns.values()],
+        "\n".join(pending_stages),
+        purpose.file_attachment_names or "",
+    )
 
 
-def build_all_csv_rows(
-    purposes: list[Purpose], stage_data: dict, pending_stages_data: dict
-) -> list[list[str]]:
-    """Build CSV rows for all purposes."""
-    return [
-        build_csv_row_for_purpose(purpose, stage_data, pending_stages_data)
-        for purpose in purposes
-    ]
+class _ChunkBuffer:
+    """File-like object collecting written text until it is drained."""
 
+    def __init__(self) -> None:
+        self._chunks: list[str] = []
+        self.write = self._chunks.append
 
-def generate_csv_string(headers: list[str], rows: list[list[str]]) -> str:
-    """Convert headers and rows into CSV string."""
-    output = io.StringIO()
-    writer = csv.writer(output, quoting=csv.QUOTE_ALL)
+    def drain(self) -> str:
+        """Return the text written since the last drain and reset the buffer."""
+        text = "".join(self._chunks)
+        self._chunks.clear()
+        return text
 
-    # Write header row
-    writer.writerow(headers)
 
-    # Write data rows
-    for row in rows:
-        writer.writerow(row)
+def iter_csv_rows(headers: list[str], rows: Iterable[tuple[str, ...]]) -> Iterator[str]:
+    """
+    Yield the CSV text of the header row and then of each block of rows.
 
-    return output.getvalue()
+    Rows are written CSV_ROWS_PER_CHUNK at a time with a single writerows call,
+    and each block is streamed as one chunk.
+    """
+    buffer = _ChunkBuffer()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
 
+    writer.writerow(headers)
+    yield buffer.drain()
+
+    rows = iter(rows)
+    while block := list(islice(rows, CSV_ROWS_PER_CHUNK)):
+        writer.writerows(block)
+        yield buffer.drain()
 
-def export_purposes_csv(db: Session, params: GetPurposesRequest) -> str:
+
+def export_purposes_csv(
+    bind: Engine | Connection, params: GetPurposesRequest
+) -> Iterator[str]:
     """
     Export purposes as CSV with filtering, searching, and sorting.
-    Returns all purposes without pagination.
-    """
-    # 1. Get data
-    purposes = get_purposes_for_export(db, params)
+    Returns all purposes without pagination, as CSV chunks for streaming.
 
-    # 2. Pre-process stage data
-    stage_data = format_purchase_stages_for_csv(purposes)
-
-    # 3. Pre-process pending stages
-    pending_stages_data = {
-        purpose.id: "\n".join(
-            [calculate_pending_stages_info(purchase) for purchase in purpose.purchases]
+    The export runs on its own session bound to the given engine, since it is
+    consumed while the response streams, after the request's session is closed.
+    """
+    # Every row counts pending stage days to the same date
+    today = date.today()
+    with Session(bind) as db:
+        purposes = iter_purposes_for_export(db, params)
+        rows = (
+            build_csv_row_for_purpose(purpose, contents, purchase_stages, today)
+            for purpose, contents, purchase_stages in purposes
         )
-        for purpose in purposes
-    }
-
-    # 4. Build CSV
-    headers = get_csv_headers()
-    rows = build_all_csv_rows(purposes, stage_data, pending_stages_data)
-
-    # 5. Generate CSV string
-    return generate_csv_string(headers, rows)
+        yield from iter_csv_rows(get_csv_headers(), rows)
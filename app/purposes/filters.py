@@ -1,11 +1,11 @@
-from sqlalchemy import Select, and_, func
+from sqlalchemy import Select, and_, func, select
 from sqlalchemy.orm import Session
 
 from app.common.hierarchy_utils import build_hierarchy_filter
 from app.hierarchies.models import Hierarchy
 from app.purchases.models import Purchase
 from app.purposes.models import Purpose, PurposeContent
-from app.purposes.pending_authority_utils import get_pending_authority_id_query
+from app.purposes.pending_authority_utils import get_pending_authority_purpose_ids_query
 from app.purposes.schemas import FilterParams
 
 
@@ -15,8 +15,6 @@ def apply_filters(
     db: Session = None,
     *,
     hierarchy_table_joined: bool = False,
-    purpose_content_table_joined: bool = False,
-    purchase_table_joined: bool = False
 ) -> Select:
     """Apply universal filters to any query that includes Purpose."""
 
@@ -48,27 +46,39 @@ def apply_filters(
     if filters.service_type_ids:
         conditions.append(Purpose.service_type_id.in_(filters.service_type_ids))
 
-    # Service filter - requires join with PurposeContent
+    # Service filter - a subquery rather than a join, so purposes with several
+    # matching contents are not repeated
     if filters.service_ids:
-        if not purpose_content_table_joined:
-            query = query.join(PurposeContent, Purpose.id == PurposeContent.purpose_id)
-        conditions.append(PurposeContent.service_id.in_(filters.service_ids))
-
-    # Pending authority filter - using correlated subquery
+        conditions.append(
+            Purpose.id.in_(
+                select(PurposeContent.purpose_id).where(
+                    PurposeContent.service_id.in_(filters.service_ids)
+                )
+            )
+        )
+
+    # Pending authority filter - purposes ranked once with a window function
     # NOTE: Must use the same logic as Purpose.pending_authority property
     if filters.pending_authorities:
-        pending_authority_subq = get_pending_authority_id_query(Purpose.id)
-        conditions.append(pending_authority_subq.in_(filters.pending_authorities))
+        pending_authority_purpose_ids = get_pending_authority_purpose_ids_query(
+            filters.pending_authorities
+        )
+        conditions.append(Purpose.id.in_(pending_authority_purpose_ids))
 
     # Flagged filter
     if filters.is_flagged is not None:
         conditions.append(Purpose.is_flagged == filters.is_flagged)
 
-    # Budget source filter - requires join with Purchase
+    # Budget source filter - a subquery rather than a join, so purposes with
+    # several matching purchases are not repeated
     if filters.budget_source_ids:
-        if not purchase_table_joined:
-            query = query.join(Purchase, Purpose.id == Purchase.purpose_id)
-        conditions.append(Purchase.budget_source_id.in_(filters.budget_source_ids))
+        conditions.append(
+            Purpose.id.in_(
+                select(Purchase.purpose_id).where(
+                    Purchase.budget_source_id.in_(filters.budget_source_ids)
+                )
+            )
+        )
 
     # Apply all conditions
     if conditions:
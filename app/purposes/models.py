@@ -14,13 +14,16 @@ from sqlalchemy import (
     event,
     func,
     insert,
+    or_,
     select,
     text,
+    update,
 )
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import (
     LoaderCallableStatus,
     Mapped,
+    Session,
     mapped_column,
     object_session,
     relationship,
@@ -240,6 +243,59 @@ def update_purpose_last_modified(connection, purpose_id: int) -> None:
     )
 
 
+# Session.info keys collecting rows touched during a flush
+_MODIFIED_PURPOSE_IDS = "modified_purpose_ids"
+_MODIFIED_PURCHASE_IDS = "modified_purchase_ids"
+
+
+def queue_purpose_last_modified(target, purpose_id: int) -> None:
+    """Queue a last_modified bump for a purpose, applied once at the end of the flush."""
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_MODIFIED_PURPOSE_IDS, set()).add(purpose_id)
+
+
+def queue_purchase_purpose_last_modified(target, purchase_id: int) -> None:
+    """Queue a last_modified bump for the purpose owning a purchase."""
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_MODIFIED_PURCHASE_IDS, set()).add(purchase_id)
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_queued_last_modified(session: Session, _flush_context) -> None:
+    """Bump last_modified for every purpose touched by the flush in one UPDATE."""
+    purpose_ids = session.info.pop(_MODIFIED_PURPOSE_IDS, None)
+    purchase_ids = session.info.pop(_MODIFIED_PURCHASE_IDS, None)
+
+    conditions = []
+    if purpose_ids:
+        conditions.append(Purpose.id.in_(purpose_ids))
+    if purchase_ids:
+        from app.purchases.models import Purchase
+
+        conditions.append(
+            Purpose.id.in_(
+                select(Purchase.purpose_id).where(Purchase.id.in_(purchase_ids))
+            )
+        )
+    if not conditions:
+        return
+
+    session.connection().execute(
+        update(Purpose.__table__)
+        .where(or_(*conditions))
+        .values(last_modified=datetime.now())
+    )
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_queued_last_modified(session: Session, _previous_transaction) -> None:
+    """Drop queued bumps from a flush that was rolled back."""
+    session.info.pop(_MODIFIED_PURPOSE_IDS, None)
+    session.info.pop(_MODIFIED_PURCHASE_IDS, None)
+
+
 # Event listeners for Purpose relationships
 @event.listens_for(Purpose.file_attachments, "append")
 @event.listens_for(Purpose.file_attachments, "remove")
@@ -260,11 +316,11 @@ def _update_purpose_on_relationship_change(target, value, initiator):
 @event.listens_for(PurposeContent, "after_update")
 @event.listens_for(PurposeContent, "after_delete")
 def _update_purpose_on_content_change(
-    _mapper, connection, target: PurposeContent
+    _mapper, _connection, target: PurposeContent
 ) -> None:
     """Update Purpose.last_modified when PurposeContent changes."""
     if hasattr(target, "purpose_id") and target.purpose_id:
-        update_purpose_last_modified(connection, target.purpose_id)
+        queue_purpose_last_modified(target, target.purpose_id)
 
 
 # Event listeners for Purpose status changes
@@ -5,7 +5,9 @@ Finds the responsible authority for the highest priority incomplete stage.
 Both filters and model properties use these functions for consistency.
 """
 
-from sqlalchemy import case, select
+from collections.abc import Iterable
+
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 
 from app.purchases.models import Purchase
@@ -14,6 +16,23 @@ from app.stage_types.models import StageType
 from app.stages.models import Stage
 
 
+def _pending_authority_ordering():
+    """Order stages so the one holding the pending authority comes first."""
+    return (
+        Stage.completion_date.is_(None).desc(),  # Incomplete stages first
+        # For incomplete stages (completion_date IS NULL): use priority ASC (lowest number = highest priority)
+        # For completed stages (completion_date IS NOT NULL): use priority DESC (highest number = lowest priority)
+        case(
+            (
+                Stage.completion_date.is_(None),
+                Stage.priority,
+            ),  # Incomplete: priority value for ASC
+            else_=-Stage.priority,  # Completed: negative priority for DESC effect
+        ).asc(),
+        StageType.id.asc(),
+    )
+
+
 def _build_base_query(purpose_id, select_clause, purchase_id=None):
     """Build the base query for pending authority lookup."""
     return (
@@ -29,19 +48,7 @@ def _build_base_query(purpose_id, select_clause, purchase_id=None):
             Purchase.purpose_id == purpose_id,
             StageType.responsible_authority_id.is_not(None),
         )
-        .order_by(
-            Stage.completion_date.is_(None).desc(),  # Incomplete stages first
-            # For incomplete stages (completion_date IS NULL): use priority ASC (lowest number = highest priority)
-            # For completed stages (completion_date IS NOT NULL): use priority DESC (highest number = lowest priority)
-            case(
-                (
-                    Stage.completion_date.is_(None),
-                    Stage.priority,
-                ),  # Incomplete: priority value for ASC
-                else_=-Stage.priority,  # Completed: negative priority for DESC effect
-            ).asc(),
-            StageType.id.asc(),
-        )
+        .order_by(*_pending_authority_ordering())
         .limit(1)
     )
 
@@ -53,6 +60,56 @@ def get_pending_authority_id_query(purpose_id):
     ).scalar_subquery()
 
 
+def get_pending_authority_purpose_ids_query(authority_ids: list[int]):
+    """
+    Get a subquery selecting the purposes whose pending authority is in authority_ids.
+
+    Ranks every purpose's stages once with a window function, using the same
+    ordering as get_pending_authority_id_query, instead of running that
+    correlated lookup for each candidate purpose row.
+    """
+    rank = (
+        func.row_number()
+        .over(partition_by=Purchase.purpose_id, order_by=_pending_authority_ordering())
+        .label("rank")
+    )
+    ranked = (
+        select(
+            Purchase.purpose_id,
+            StageType.responsible_authority_id.label("authority_id"),
+            rank,
+        )
+        .join(Stage, Purchase.id == Stage.purchase_id)
+        .join(StageType, Stage.stage_type_id == StageType.id)
+        .where(StageType.responsible_authority_id.is_not(None))
+        .subquery()
+    )
+    return select(ranked.c.purpose_id).where(
+        ranked.c.rank == 1, ranked.c.authority_id.in_(authority_ids)
+    )
+
+
+def get_purchase_pending_authority_id_query(purchase_id):
+    """
+    Get a scalar subquery returning the pending authority ID of one purchase.
+
+    Pass a column such as Purchase.id to correlate it with an outer query, so
+    the authority can be joined onto purchase rows in the same SELECT.
+    """
+    return (
+        select(StageType.responsible_authority_id)
+        .select_from(Stage)
+        .join(StageType, Stage.stage_type_id == StageType.id)
+        .where(
+            Stage.purchase_id == purchase_id,
+            StageType.responsible_authority_id.is_not(None),
+        )
+        .order_by(*_pending_authority_ordering())
+        .limit(1)
+        .scalar_subquery()
+    )
+
+
 def get_pending_authority_object(
     db: Session, purpose_id: int, purchase_id: int | None = None
 ) -> ResponsibleAuthority | None:
@@ -60,3 +117,59 @@ def get_pending_authority_object(
     # Create a query that selects only the ResponsibleAuthority object
     query = _build_base_query(purpose_id, select(ResponsibleAuthority), purchase_id)
     return db.execute(query).scalar_one_or_none()
+
+
+def get_purchase_pending_authorities(
+    db: Session, purchase_ids: list[int]
+) -> dict[int, ResponsibleAuthority]:
+    """
+    Get the pending authority of many purchases with a single query.
+
+    Ranks each purchase's stages with the same ordering as the per-purchase
+    lookup and keeps the first one. Purchases without a pending authority are
+    absent from the result.
+    """
+    if not purchase_ids:
+        return {}
+
+    rank = (
+        func.row_number()
+        .over(partition_by=Stage.purchase_id, order_by=_pending_authority_ordering())
+        .label("rank")
+    )
+    ranked = (
+        select(
+            Stage.purchase_id,
+            StageType.responsible_authority_id.label("authority_id"),
+            rank,
+        )
+        .join(StageType, Stage.stage_type_id == StageType.id)
+        .where(
+            Stage.purchase_id.in_(purchase_ids),
+            StageType.responsible_authority_id.is_not(None),
+        )
+        .subquery()
+    )
+    stmt = (
+        select(ranked.c.purchase_id, ResponsibleAuthority)
+        .join(ResponsibleAuthority, ResponsibleAuthority.id == ranked.c.authority_id)
+        .where(ranked.c.rank == 1)
+    )
+    return {purchase_id: authority for purchase_id, authority in db.execute(stmt)}
+
+
+def prime_purchase_pending_authorities(
+    db: Session, purchases: Iterable[Purchase]
+) -> None:
+    """
+    Attach pending authorities to loaded purchases ahead of serialization.
+
+    Purchase.pending_authority returns the primed value instead of issuing its
+    own query, so serializing N purchases costs one query instead of N.
+    """
+    purchases = list(purchases)
+    authorities = get_purchase_pending_authorities(
+        db, [purchase.id for purchase in purchases]
+    )
+    for purchase in purchases:
+        purchase.set_pending_authority(authorities.get(purchase.id))
@@ -4,9 +4,11 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
 from fastapi import status as statuses
 from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.auth.dependencies import require_admin
+from app.common.responses import json_response
 from app.database import get_db
 from app.files.exceptions import FileNotFoundError, FileUploadError
 from app.files.schemas import FileAttachmentResponse
@@ -30,8 +32,16 @@ from app.purposes.schemas import (
 
 router = APIRouter()
 
+# Built once so a page of purposes (with their purchases) is validated in a
+# single pass over one core schema
+purpose_list_adapter = TypeAdapter(list[Purpose])
 
-@router.get("/", response_model=PaginatedResult[Purpose])
+
+@router.get(
+    "/",
+    response_model=None,
+    responses={200: {"model": PaginatedResult[Purpose]}},
+)
 def get_purposes(
     params: Annotated[GetPurposesRequest, Query()],
     db: Session = Depends(get_db),
@@ -42,7 +52,9 @@ def get_purposes(
         params=params,
     )
 
-    return create_paginated_result(purposes, total, params)
+    items = purpose_list_adapter.validate_python(purposes, from_attributes=True)
+    result = create_paginated_result(items, total, params)
+    return json_response(result)
 
 
 @router.get("/export_csv")
@@ -51,7 +63,9 @@ def export_csv(
     db: Session = Depends(get_db),
 ):
     """Export all purposes as CSV with the same filtering, searching, and sorting as get_purposes."""
-    csv_content = export_purposes_csv(db=db, params=params)
+    # Rows are written to the client as they are built; the request session is
+    # closed before the body streams, so the export opens its own on the same bind
+    csv_rows = export_purposes_csv(bind=db.get_bind(), params=params)
 
     # Generate filename with current date
     current_date = datetime.now().strftime("%d-%m-%Y")
@@ -59,7 +73,7 @@ def export_csv(
 
     # Create streaming response for CSV download
     response = StreamingResponse(
-        iter([csv_content]),
+        csv_rows,
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
@@ -1,7 +1,7 @@
 from typing import Sequence
 
 from sqlalchemy import or_, select
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, selectinload
 
 from app import FileAttachment, Purchase, Stage
 from app.budget_sources.models import BudgetSource
@@ -14,6 +14,7 @@ from app.purposes.exceptions import (
 )
 from app.purposes.filters import apply_filters
 from app.purposes.models import Purpose, PurposeContent
+from app.purposes.pending_authority_utils import prime_purchase_pending_authorities
 from app.purposes.schemas import (
     GetPurposesRequest,
     PurposeContentBase,
@@ -27,17 +28,23 @@ from app.suppliers.models import Supplier
 
 
 def get_base_purpose_select():
-    """Get base purpose select statement with all necessary joins."""
+    """
+    Get base purpose select statement with all necessary eager loads.
+
+    Collections are loaded with selectinload so a page of purposes costs one
+    extra query per relationship level instead of one per row, and without
+    multiplying the purpose rows through joined collections.
+    """
     return select(Purpose).options(
-        joinedload(Purpose.file_attachments),
-        joinedload(Purpose.contents)
+        selectinload(Purpose.file_attachments),
+        selectinload(Purpose.contents)
         .joinedload(PurposeContent.service)
         .joinedload(Service.service_type),
-        joinedload(Purpose.purchases)
-        .joinedload(Purchase.stages)
+        selectinload(Purpose.purchases)
+        .selectinload(Purchase.stages)
         .joinedload(Stage.stage_type),
-        joinedload(Purpose.purchases).joinedload(Purchase.costs),
-        joinedload(Purpose.purchases).joinedload(Purchase.budget_source),
+        selectinload(Purpose.purchases).selectinload(Purchase.costs),
+        selectinload(Purpose.purchases).joinedload(Purchase.budget_source),
     )
 
 
@@ -120,7 +127,10 @@ def _set_file_attachments(
 def get_purpose(db: Session, purpose_id: int) -> Purpose | None:
     """Get a single purpose by ID."""
     stmt = get_base_purpose_select().where(Purpose.id == purpose_id)
-    return db.execute(stmt).unique().scalars().first()
+    purpose = db.execute(stmt).unique().scalars().first()
+    if purpose:
+        prime_purchase_pending_authorities(db, purpose.purchases)
+    return purpose
 
 
 def get_purposes(db: Session, params: GetPurposesRequest) -> tuple[list[Purpose], int]:
@@ -144,7 +154,13 @@ def get_purposes(db: Session, params: GetPurposesRequest) -> tuple[list[Purpose]
     stmt = apply_sorting(stmt, params.sort_by, params.sort_order)
 
     # Apply pagination
-    return paginate_select(db, stmt, params)
+    purposes, total = paginate_select(db, stmt, params)
+
+    # Resolve purchase pending authorities for the whole page at once
+    prime_purchase_pending_authorities(
+        db, (purchase for purpose in purposes for purchase in purpose.purchases)
+    )
+    return purposes, total
 
 
 def create_purpose(db: Session, purpose: PurposeCreate) -> Purpose:
@@ -5,6 +5,14 @@ from sqlalchemy import Date, case, desc, func, select
 from app import Purchase, Stage
 from app.purposes.models import Purpose
 
+# Purpose columns accepted by sort_by besides days_since_last_completion; any
+# other value sorts by creation_time
+SORTABLE_COLUMNS = {
+    "creation_time": Purpose.creation_time,
+    "last_modified": Purpose.last_modified,
+    "expected_delivery": Purpose.expected_delivery,
+}
+
 
 def apply_sorting(stmt, sort_by: str, sort_order: str):
     """
@@ -29,7 +37,7 @@ def apply_sorting(stmt, sort_by: str, sort_order: str):
             sort_column = days_subquery.c.days_since_last_completion.nulls_last()
     else:
         # Standard column sorting
-        sort_column = getattr(Purpose, sort_by, Purpose.creation_time)
+        sort_column = SORTABLE_COLUMNS.get(sort_by, Purpose.creation_time)
 
         if sort_order == "desc":
             sort_column = desc(sort_column)
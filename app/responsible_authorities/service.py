@@ -1,7 +1,8 @@
-from sqlalchemy import select
+from sqlalchemy import RowMapping, select
 from sqlalchemy.orm import Session
 
-from app.pagination import PaginationParams, paginate_select
+from app.pagination import PaginationParams, paginate_select_raw
+from app.predefined_flows.cache import flows_list_cache
 from app.responsible_authorities.exceptions import (
     ResponsibleAuthorityAlreadyExists,
     ResponsibleAuthorityNotFound,
@@ -23,7 +24,7 @@ def get_responsible_authority(
 
 def get_responsible_authorities(
     db: Session, pagination: PaginationParams, search: str | None = None
-) -> tuple[list[ResponsibleAuthority], int]:
+) -> tuple[list[RowMapping], int]:
     """
     Get responsible authorities with pagination and optional search.
 
@@ -35,7 +36,7 @@ def get_responsible_authorities(
     Returns:
         Tuple of (authorities list, total count)
     """
-    stmt = select(ResponsibleAuthority)
+    stmt = select(ResponsibleAuthority.__table__)
 
     # Apply search filter if provided
     if search:
@@ -44,7 +45,7 @@ def get_responsible_authorities(
     # Apply ordering
     stmt = stmt.order_by(ResponsibleAuthority.name)
 
-    return paginate_select(db, stmt, pagination)
+    return paginate_select_raw(db, stmt, pagination)
 
 
 def create_responsible_authority(
@@ -93,6 +94,7 @@ def patch_responsible_authority(
             setattr(db_authority, field, value)
 
     db.commit()
+    flows_list_cache.clear()
     db.refresh(db_authority)
     return db_authority
 
@@ -106,3 +108,4 @@ def delete_responsible_authority(db: Session, authority_id: int) -> None:
 
     db.delete(db_authority)
     db.commit()
+    flows_list_cache.clear()
@@ -1,7 +1,7 @@
-from sqlalchemy import select
+from sqlalchemy import RowMapping, select
 from sqlalchemy.orm import Session
 
-from app.pagination import PaginationParams, paginate_select
+from app.pagination import PaginationParams, paginate_select_raw
 from app.service_types.exceptions import ServiceTypeAlreadyExists, ServiceTypeNotFound
 from app.service_types.models import ServiceType
 from app.service_types.schemas import ServiceTypeCreate, ServiceTypeUpdate
@@ -15,7 +15,7 @@ def get_service_type(db: Session, service_type_id: int) -> ServiceType | None:
 
 def get_service_types(
     db: Session, pagination: PaginationParams, search: str | None = None
-) -> tuple[list[ServiceType], int]:
+) -> tuple[list[RowMapping], int]:
     """
     Get service types with pagination and optional search.
 
@@ -27,7 +27,7 @@ def get_service_types(
     Returns:
         Tuple of (service_types list, total count)
     """
-    stmt = select(ServiceType)
+    stmt = select(ServiceType.__table__)
 
     # Apply search filter if provided
     if search:
@@ -36,7 +36,7 @@ def get_service_types(
     # Apply ordering
     stmt = stmt.order_by(ServiceType.name)
 
-    return paginate_select(db, stmt, pagination)
+    return paginate_select_raw(db, stmt, pagination)
 
 
 def create_service_type(db: Session, service_type: ServiceTypeCreate) -> ServiceType:
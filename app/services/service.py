@@ -1,7 +1,7 @@
-from sqlalchemy import select
+from sqlalchemy import RowMapping, select
 from sqlalchemy.orm import Session
 
-from app.pagination import PaginationParams, paginate_select
+from app.pagination import PaginationParams, paginate_select_raw
 from app.service_types.models import ServiceType
 from app.services.exceptions import (
     InvalidServiceTypeId,
@@ -23,7 +23,7 @@ def get_services(
     pagination: PaginationParams,
     search: str | None = None,
     service_type_id: int | None = None,
-) -> tuple[list[Service], int]:
+) -> tuple[list[RowMapping], int]:
     """
     Get services with pagination and optional search and filtering.
 
@@ -36,7 +36,7 @@ def get_services(
     Returns:
         Tuple of (services list, total count)
     """
-    stmt = select(Service)
+    stmt = select(Service.__table__)
 
     # Apply service_type_id filter if provided
     if service_type_id is not None:
@@ -49,7 +49,7 @@ def get_services(
     # Apply ordering
     stmt = stmt.order_by(Service.name)
 
-    return paginate_select(db, stmt, pagination)
+    return paginate_select_raw(db, stmt, pagination)
 
 
 def create_service(db: Session, service: ServiceCreate) -> Service:
@@ -0,0 +1,74 @@
+"""Batched stage type lookups for a single request."""
+
+import asyncio
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.stage_types.models import StageType
+
+
+class StageTypeLoader:
+    """
+    Coalesce stage type lookups by name or ID into one query per dispatch.
+
+    Callers queue lookups with load_by_name/load_by_id, which return futures,
+    then await dispatch() once to resolve all of them. Each future resolves to
+    the stage type ID, or None if no such stage type exists. Results are
+    memoized, so a loader should live no longer than one request.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._pending_names: dict[str, asyncio.Future[int | None]] = {}
+        self._pending_ids: dict[int, asyncio.Future[int | None]] = {}
+        self._ids_by_name: dict[str, int | None] = {}
+        self._known_ids: dict[int, int | None] = {}
+
+    def load_by_name(self, name: str) -> asyncio.Future[int | None]:
+        """Queue a lookup of a stage type ID by name."""
+        return self._load(name, self._ids_by_name, self._pending_names)
+
+    def load_by_id(self, stage_type_id: int) -> asyncio.Future[int | None]:
+        """Queue an existence check for a stage type ID."""
+        return self._load(stage_type_id, self._known_ids, self._pending_ids)
+
+    async def dispatch(self) -> None:
+        """Resolve every pending lookup with a single query."""
+        if not self._pending_names and not self._pending_ids:
+            return
+
+        pending_names, self._pending_names = self._pending_names, {}
+        pending_ids, self._pending_ids = self._pending_ids, {}
+
+        stmt = select(StageType.id, StageType.name).where(
+            or_(
+                StageType.name.in_(list(pending_names)),
+                StageType.id.in_(list(pending_ids)),
+            )
+        )
+        rows = (await self.db.execute(stmt)).all()
+        found_by_name = {name: stage_type_id for stage_type_id, name in rows}
+        found_ids = {stage_type_id for stage_type_id, _ in rows}
+
+        for name, future in pending_names.items():
+            self._ids_by_name[name] = found_by_name.get(name)
+            future.set_result(self._ids_by_name[name])
+
+        for stage_type_id, future in pending_ids.items():
+            self._known_ids[stage_type_id] = (
+                stage_type_id if stage_type_id in found_ids else None
+            )
+            future.set_result(self._known_ids[stage_type_id])
+
+    @staticmethod
+    def _load(key, resolved: dict, pending: dict) -> asyncio.Future[int | None]:
+        if key in pending:
+            return pending[key]
+
+        future = asyncio.get_running_loop().create_future()
+        if key in resolved:
+            future.set_result(resolved[key])
+        else:
+            pending[key] = future
+        return future
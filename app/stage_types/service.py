@@ -2,6 +2,7 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.pagination import PaginationParams, paginate_select
+from app.predefined_flows.cache import flows_list_cache
 from app.stage_types.exceptions import StageTypeAlreadyExists, StageTypeNotFound
 from app.stage_types.models import StageType
 from app.stage_types.schemas import StageTypeCreate, StageTypeUpdate
@@ -81,6 +82,7 @@ def patch_stage_type(
             setattr(db_stage_type, field, value)
 
     db.commit()
+    flows_list_cache.clear()
     db.refresh(db_stage_type)
     return db_stage_type
 
@@ -94,3 +96,4 @@ def delete_stage_type(db: Session, stage_type_id: int) -> None:
 
     db.delete(db_stage_type)
     db.commit()
+    flows_list_cache.clear()
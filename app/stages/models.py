@@ -1,8 +1,8 @@
 from datetime import date
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Date, ForeignKey, Integer, String, Text, event, text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Date, ForeignKey, Index, Integer, String, Text, event, text
+from sqlalchemy.orm import Mapped, mapped_column, object_session, relationship
 
 from app.database import Base
 
@@ -31,6 +31,19 @@ class Stage(Base):
     stage_type: Mapped["StageType"] = relationship("StageType", back_populates="stages")
     purchase: Mapped["Purchase"] = relationship("Purchase", back_populates="stages")
 
+    # Partial index matching the pending-authority lookup, which scans a
+    # purchase's incomplete stages ordered by (priority, stage_type_id)
+    __table_args__ = (
+        Index(
+            "ix_stage_purchase_priority_pending",
+            "purchase_id",
+            "priority",
+            "stage_type_id",
+            postgresql_where=text("completion_date IS NULL"),
+            sqlite_where=text("completion_date IS NULL"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Stage(id={self.id}, priority={self.priority}, completed={self.completion_date is not None})>"
 
@@ -39,15 +52,26 @@ class Stage(Base):
 @event.listens_for(Stage, "after_insert")
 @event.listens_for(Stage, "after_update")
 @event.listens_for(Stage, "after_delete")
-def _update_purpose_on_stage_change(_mapper, connection, target: Stage) -> None:
+def _update_purpose_on_stage_change(_mapper, _connection, target: Stage) -> None:
     """Update Purpose.last_modified when Stage changes."""
     if hasattr(target, "purchase_id") and target.purchase_id:
-        # Query for purpose_id through purchase
-        result = connection.execute(
-            text("SELECT purpose_id FROM purchase WHERE id = :purchase_id"),
-            {"purchase_id": target.purchase_id},
-        ).fetchone()
-        if result and result[0]:
-            from app.purposes.models import update_purpose_last_modified
-
-            update_purpose_last_modified(connection, result[0])
+        # The owning purpose is resolved in the single end-of-flush UPDATE
+        from app.purposes.models import queue_purchase_purpose_last_modified
+
+        queue_purchase_purpose_last_modified(target, target.purchase_id)
+
+
+@event.listens_for(Stage.priority, "set")
+def _reset_purchase_flow_stages(target: Stage, _value, _oldvalue, _initiator) -> None:
+    """Reset the owning purchase's memoized flow stages when a priority changes."""
+    session = object_session(target)
+    if session is None or target.purchase_id is None:
+        return
+
+    from app.purchases.models import Purchase
+
+    purchase = session.identity_map.get(
+        session.identity_key(Purchase, target.purchase_id)
+    )
+    if purchase is not None:
+        purchase.invalidate_flow_stages()
@@ -1,9 +1,8 @@
 """Service layer for stage operations."""
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session, joinedload
 
-from app.predefined_flows.models import PredefinedFlow
 from app.purchases.schemas import StageEditItem
 from app.stage_types.models import StageType
 from app.stages.exceptions import InvalidStageValue, StageNotFound
@@ -45,30 +44,33 @@ def update_stage(db: Session, stage_id: int, stage_update: StageUpdate) -> Stage
 
 
 def create_stages_from_flow(
-    db: Session, purchase_id: int, predefined_flow: PredefinedFlow
-) -> list[Stage]:
+    db: Session, purchase_id: int, stage_pairs: list[tuple[int, int]]
+) -> None:
     """
     Create stages for a purchase based on a predefined flow.
 
+    The stages are written with a single bulk INSERT rather than as ORM objects,
+    so they are not added to the purchase's loaded stages collection.
+
     Args:
         db: Database session
         purchase_id: ID of the purchase to create stages for
-        predefined_flow: Predefined flow with stage definitions
-
-    Returns:
-        List of created Stage objects
+        stage_pairs: (priority, stage_type_id) pairs of the predefined flow
     """
-    stages = [
-        Stage(
-            stage_type_id=predefined_stage.stage_type_id,
-            priority=predefined_stage.priority,
-            purchase_id=purchase_id,
-        )
-        for predefined_stage in predefined_flow.predefined_flow_stages
-    ]
-
-    db.add_all(stages)
-    return stages
+    if not stage_pairs:
+        return
+
+    db.execute(
+        insert(Stage),
+        [
+            {
+                "stage_type_id": stage_type_id,
+                "priority": priority,
+                "purchase_id": purchase_id,
+            }
+            for priority, stage_type_id in stage_pairs
+        ],
+    )
 
 
 def _get_or_create_custom_stage_type(db: Session) -> StageType:
@@ -3,6 +3,7 @@
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.common.priority_utils import flatten_by_priority
 from app.purchases.schemas import StageEdit, StageEditItem
 from app.stage_types.exceptions import StageTypeNotFound
 from app.stage_types.models import StageType
@@ -26,20 +27,10 @@ def flatten_stage_edits_with_priorities(
         Input: [stage1, [stage2, stage3], stage4]
         Output: [(stage1, 1), (stage2, 2), (stage3, 2), (stage4, 3)]
     """
-    flattened = []
-    priority = 1
-
-    for item in stage_edits:
-        if isinstance(item, list):
-            # Multiple stages at same priority
-            for stage_edit in item:
-                flattened.append((stage_edit, priority))
-        else:
-            # Single stage
-            flattened.append((item, priority))
-        priority += 1
-
-    return flattened
+    return [
+        (stage_edit, priority)
+        for priority, stage_edit in flatten_by_priority(stage_edits)
+    ]
 
 
 def _validate_stage_edit(db: Session, stage_edit: StageEdit, purchase_id: int) -> None:
@@ -57,18 +48,16 @@ def _validate_stage_edit(db: Session, stage_edit: StageEdit, purchase_id: int) -
     """
     if stage_edit.id is not None:
         # Validate existing stage
-        stmt = select(Stage).where(
+        stmt = select(Stage.id).where(
             Stage.id == stage_edit.id, Stage.purchase_id == purchase_id
         )
-        existing_stage = db.execute(stmt).scalar_one_or_none()
-        if not existing_stage:
+        if db.execute(stmt).scalar_one_or_none() is None:
             raise StageNotFound(stage_edit.id)
 
     if stage_edit.stage_type_id is not None:
         # Validate stage type exists
-        stmt = select(StageType).where(StageType.id == stage_edit.stage_type_id)
-        stage_type = db.execute(stmt).scalar_one_or_none()
-        if not stage_type:
+        stmt = select(StageType.id).where(StageType.id == stage_edit.stage_type_id)
+        if db.execute(stmt).scalar_one_or_none() is None:
             raise StageTypeNotFound(stage_edit.stage_type_id)
 
 
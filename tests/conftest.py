@@ -10,11 +10,23 @@ from typing import Generator  # noqa: E402
 import pytest  # noqa: E402
 from fastapi.testclient import TestClient  # noqa: E402
 from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
 from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import NullPool  # noqa: E402
 
 from app.auth.dependencies import require_auth  # noqa: E402
-from app.database import Base, get_db  # noqa: E402
+from app.common.lazy_loads import (  # noqa: E402
+    disable_lazy_load_detection,
+    enable_lazy_load_detection,
+)
+from app.database import (  # noqa: E402
+    Base,
+    get_async_database_url,
+    get_async_db,
+    get_db,
+)
 from app.main import app  # noqa: E402
+from app.predefined_flows.cache import flows_list_cache  # noqa: E402
 from tests.auth_mock import (  # noqa: E402
     mock_auth_dependency,
     mock_auth_dependency_no_admin,
@@ -43,6 +55,13 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine on the same database; NullPool since each test request may run
+# on its own event loop and pooled async connections are loop-bound
+async_engine = create_async_engine(
+    get_async_database_url(SQLALCHEMY_DATABASE_URL), poolclass=NullPool
+)
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False)
+
 
 @pytest.fixture(scope="function", autouse=True)
 def test_db() -> Generator:
@@ -50,6 +69,7 @@ def test_db() -> Generator:
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
+    flows_list_cache.clear()
 
 
 def override_get_db():
@@ -61,6 +81,12 @@ def override_get_db():
         session.close()
 
 
+async def override_get_async_db():
+    """Shared async database override function for tests."""
+    async with TestingAsyncSessionLocal() as session:
+        yield session
+
+
 @pytest.fixture(scope="function")
 def db_session(test_db):
     """Create database session for tests."""
@@ -71,11 +97,20 @@ def db_session(test_db):
         session.close()
 
 
+@pytest.fixture(scope="function")
+def forbid_lazy_loads():
+    """Fail the test on any relationship lazy load while it runs."""
+    enable_lazy_load_detection(raise_on_lazy_load=True)
+    yield
+    disable_lazy_load_detection()
+
+
 @pytest.fixture(scope="function")
 def test_client(test_db):
     """Create test client with test database and mock authentication."""
     # Override dependencies for testing
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     app.dependency_overrides[require_auth] = mock_auth_dependency
 
     client = TestClient(app)
@@ -90,6 +125,7 @@ def test_client_no_admin(test_db):
     """Create test client with test database and mock regular user authentication."""
     # Override dependencies for testing with regular user
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     app.dependency_overrides[require_auth] = mock_auth_dependency_no_admin
 
     client = TestClient(app)
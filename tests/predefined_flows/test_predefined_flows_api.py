@@ -1,6 +1,7 @@
 from fastapi.testclient import TestClient
 
 from app.config import settings
+from app.pagination import encode_cursor
 from tests.base import BaseAPITestClass
 from tests.utils import APITestHelper
 
@@ -39,6 +40,88 @@ class TestPredefinedFlowsAPI(BaseAPITestClass):
         response = test_client.post(self.resource_endpoint, json=duplicate_data)
         assert response.status_code == 409
 
+    def test_update_flow_name_to_existing_name(
+        self, test_client: TestClient, multiple_predefined_flows
+    ):
+        """Test renaming a flow to another flow's name returns conflict."""
+        flow, other_flow = multiple_predefined_flows[0], multiple_predefined_flows[1]
+        response = test_client.patch(
+            f"{self.resource_endpoint}/{flow['id']}",
+            json={"flow_name": other_flow["flow_name"]},
+        )
+        assert response.status_code == 409
+
+    def test_update_flow_name_to_own_name(
+        self, test_client: TestClient, sample_predefined_flow
+    ):
+        """Test renaming a flow to its current name is allowed."""
+        response = test_client.patch(
+            f"{self.resource_endpoint}/{sample_predefined_flow.id}",
+            json={"flow_name": sample_predefined_flow.flow_name},
+        )
+        assert response.status_code == 200
+        assert response.json()["flow_name"] == sample_predefined_flow.flow_name
+
+    def test_list_reflects_writes_despite_cache(
+        self, test_client: TestClient, sample_predefined_flow_data
+    ):
+        """Test that flow writes invalidate the cached list responses."""
+        assert test_client.get(self.resource_endpoint).json()["total"] == 0
+
+        response = test_client.post(
+            self.resource_endpoint, json=sample_predefined_flow_data
+        )
+        assert response.status_code == 201
+        flow_id = response.json()["id"]
+        assert test_client.get(self.resource_endpoint).json()["total"] == 1
+
+        response = test_client.patch(
+            f"{self.resource_endpoint}/{flow_id}", json={"flow_name": "Renamed Flow"}
+        )
+        assert response.status_code == 200
+        items = test_client.get(self.resource_endpoint).json()["items"]
+        assert items[0]["flow_name"] == "Renamed Flow"
+
+        response = test_client.delete(f"{self.resource_endpoint}/{flow_id}")
+        assert response.status_code == 204
+        assert test_client.get(self.resource_endpoint).json()["total"] == 0
+
+    def test_list_reflects_stage_type_writes_despite_cache(
+        self, test_client: TestClient, sample_predefined_flow, test_stage_types
+    ):
+        """Test that stage type and authority writes invalidate cached lists."""
+        stage_type = sample_predefined_flow.predefined_flow_stages[0].stage_type
+        assert test_client.get(self.resource_endpoint).json()["total"] == 1
+
+        response = test_client.post(
+            f"{settings.api_v1_prefix}/responsible-authorities",
+            json={"name": "Finance"},
+        )
+        assert response.status_code == 201
+        authority_id = response.json()["id"]
+
+        response = test_client.patch(
+            f"{settings.api_v1_prefix}/stage-types/{stage_type.id}",
+            json={
+                "display_name": "Renamed Stage",
+                "responsible_authority_id": authority_id,
+            },
+        )
+        assert response.status_code == 200
+        items = test_client.get(self.resource_endpoint).json()["items"]
+        first_stage = items[0]["flow_stages"][0]["stage_type"]
+        assert first_stage["display_name"] == "Renamed Stage"
+        assert first_stage["responsible_authority"]["name"] == "Finance"
+
+        response = test_client.patch(
+            f"{settings.api_v1_prefix}/responsible-authorities/{authority_id}",
+            json={"name": "Procurement"},
+        )
+        assert response.status_code == 200
+        items = test_client.get(self.resource_endpoint).json()["items"]
+        first_stage = items[0]["flow_stages"][0]["stage_type"]
+        assert first_stage["responsible_authority"]["name"] == "Procurement"
+
     def test_predefined_flows_sorted_by_name(
         self, test_client: TestClient, multiple_predefined_flows
     ):
@@ -130,6 +213,29 @@ class TestPredefinedFlowsAPI(BaseAPITestClass):
         # Second priority should be single stage
         assert isinstance(flow_stages[1], dict)
 
+    def test_update_flow_stages_keeps_unchanged_stages(
+        self, test_client: TestClient, sample_predefined_flow, test_stage_types
+    ):
+        """Test updating flow stages only replaces stages that changed."""
+        endpoint = f"{self.resource_endpoint}/{sample_predefined_flow.id}"
+        original_stages = test_client.get(endpoint).json()["flow_stages"]
+        first_stage_id = original_stages[0]["id"]
+
+        stage_ids = [st.id for st in test_stage_types]
+        update_data = {"stages": [stage_ids[0], stage_ids[3]]}
+        response = test_client.patch(endpoint, json=update_data)
+        assert response.status_code == 200
+
+        flow_stages = response.json()["flow_stages"]
+        assert len(flow_stages) == 2
+        # Priority 1 is unchanged and keeps its row
+        assert flow_stages[0]["id"] == first_stage_id
+        assert flow_stages[0]["stage_type_id"] == stage_ids[0]
+        # Priority 2 is replaced by a single new stage
+        assert isinstance(flow_stages[1], dict)
+        assert flow_stages[1]["stage_type_id"] == stage_ids[3]
+        assert flow_stages[1]["priority"] == 2
+
     def test_flow_stage_type_relationships(
         self, test_client: TestClient, sample_predefined_flow
     ):
@@ -265,3 +371,42 @@ class TestPredefinedFlowsAPI(BaseAPITestClass):
             assert "stages" in item
             assert "flow_stages" not in item
             assert all(isinstance(stage, (str, list)) for stage in item["stages"])
+
+    def test_cursor_pagination_walks_all_flows_in_order(
+        self, test_client: TestClient, multiple_predefined_flows
+    ):
+        """Test that following next_cursor returns every flow once, sorted by name."""
+        names = []
+        params = {"limit": 2}
+        while True:
+            response = test_client.get(
+                f"{self.resource_endpoint}/cursor", params=params
+            )
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data["items"]) <= 2
+            names.extend(item["flow_name"] for item in data["items"])
+            if not data["has_next"]:
+                assert data["next_cursor"] is None
+                break
+            params = {"limit": 2, "cursor": data["next_cursor"]}
+
+        assert names == sorted(flow["flow_name"] for flow in multiple_predefined_flows)
+
+    def test_cursor_pagination_invalid_cursor(self, test_client: TestClient):
+        """Test that a malformed cursor is rejected."""
+        response = test_client.get(
+            f"{self.resource_endpoint}/cursor", params={"cursor": "not-a-cursor"}
+        )
+        assert response.status_code == 400
+
+    def test_cursor_pagination_type_mismatched_cursor(
+        self, test_client: TestClient, multiple_predefined_flows
+    ):
+        """Test that a well-formed cursor with wrongly typed values is rejected."""
+        for key in ([1, "x"], ["Flow", "1"], ["Flow", True], ["Flow", None]):
+            response = test_client.get(
+                f"{self.resource_endpoint}/cursor",
+                params={"cursor": encode_cursor(tuple(key))},
+            )
+            assert response.status_code == 400
@@ -3,8 +3,11 @@
 from datetime import date
 
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
 
 from app.config import settings
+from app.purchases import service as purchase_service
+from app.purchases.schemas import PurchaseResponse
 
 
 class TestPurchaseComputedFields:
@@ -198,3 +201,17 @@ class TestPurchaseComputedFields:
                 assert "id" in stage
                 assert "priority" in stage
                 assert "completion_date" in stage
+
+    def test_purchase_to_response_matches_validation(
+        self, db_session: Session, sample_purchase_with_completed_stage
+    ):
+        """Test that the constructed response serializes like a validated one."""
+        purchase = purchase_service.get_purchase(
+            db_session, sample_purchase_with_completed_stage.id
+        )
+
+        constructed = purchase_service.purchase_to_response(purchase)
+        validated = PurchaseResponse.model_validate(purchase)
+
+        assert constructed.model_dump_json() == validated.model_dump_json()
+        assert constructed.days_since_last_completion == 0
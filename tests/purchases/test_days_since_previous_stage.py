@@ -47,7 +47,7 @@ class TestDaysSincePreviousStage:
         }
 
         purchase = PurchaseResponse.model_validate(purchase_data)
-        assert purchase.flow_stages[0].days_since_previous_stage is None
+        assert purchase.flow_stages[0][0].days_since_previous_stage is None
 
     def test_priority_1_completed_stage_returns_none(self, sample_stage_type):
         """Test that even completed priority 1 stages return None for days_since_previous_stage."""
@@ -73,7 +73,7 @@ class TestDaysSincePreviousStage:
         }
 
         purchase = PurchaseResponse.model_validate(purchase_data)
-        assert purchase.flow_stages[0].days_since_previous_stage is None
+        assert purchase.flow_stages[0][0].days_since_previous_stage is None
 
     def test_higher_priority_stage_uses_previous_completion(self, sample_stage_type):
         """Test that higher priority stages use previous stage completion as reference."""
@@ -110,9 +110,9 @@ class TestDaysSincePreviousStage:
 
         purchase = PurchaseResponse.model_validate(purchase_data)
         # Stage 1 (priority 1): Always None
-        assert purchase.flow_stages[0].days_since_previous_stage is None
+        assert purchase.flow_stages[0][0].days_since_previous_stage is None
         # Stage 2: 4 days from stage 1 completion to now
-        assert purchase.flow_stages[1].days_since_previous_stage == 4
+        assert purchase.flow_stages[1][0].days_since_previous_stage == 4
 
     def test_multiple_stages_same_priority(self, sample_stage_type):
         """Test calculation with multiple stages at same priority level."""
@@ -165,7 +165,7 @@ class TestDaysSincePreviousStage:
         assert purchase.flow_stages[0][1].days_since_previous_stage is None
 
         # Priority 2 stage uses most recent completion from priority 1 (3 days ago)
-        assert purchase.flow_stages[1].days_since_previous_stage == 3
+        assert purchase.flow_stages[1][0].days_since_previous_stage == 3
 
     def test_missing_previous_priority_returns_none(self, sample_stage_type):
         """Test that missing previous priority stages return None."""
@@ -191,7 +191,7 @@ class TestDaysSincePreviousStage:
         }
 
         purchase = PurchaseResponse.model_validate(purchase_data)
-        assert purchase.flow_stages[0].days_since_previous_stage is None
+        assert purchase.flow_stages[0][0].days_since_previous_stage is None
 
     def test_no_completed_previous_priority_returns_none(self, sample_stage_type):
         """Test that uncompleted previous priority stages return None."""
@@ -227,10 +227,10 @@ class TestDaysSincePreviousStage:
 
         purchase = PurchaseResponse.model_validate(purchase_data)
         assert (
-            purchase.flow_stages[0].days_since_previous_stage is None
+            purchase.flow_stages[0][0].days_since_previous_stage is None
         )  # Priority 1 always None
         assert (
-            purchase.flow_stages[1].days_since_previous_stage is None
+            purchase.flow_stages[1][0].days_since_previous_stage is None
         )  # No completed previous stage
 
     def test_empty_flow_stages(self):
@@ -245,3 +245,32 @@ class TestDaysSincePreviousStage:
 
         purchase = PurchaseResponse.model_validate(purchase_data)
         assert purchase.flow_stages == []
+
+    def test_single_priority_level_returns_none(self, sample_stage_type):
+        """Test that stages sharing the only priority level all return None."""
+        stages = [
+            StageResponse(
+                id=stage_id,
+                purchase_id=1,
+                stage_type_id=1,
+                priority=1,
+                value=None,
+                completion_date=completion_date,
+                stage_type=sample_stage_type,
+            )
+            for stage_id, completion_date in [(1, date.today()), (2, None)]
+        ]
+
+        purchase_data = {
+            "id": 1,
+            "purpose_id": 1,
+            "creation_date": datetime.now(),
+            "costs": [],
+            "flow_stages": [stages],
+        }
+
+        purchase = PurchaseResponse.model_validate(purchase_data)
+        assert all(
+            stage.days_since_previous_stage is None for stage in purchase.flow_stages[0]
+        )
+        assert purchase.days_since_last_completion is None
@@ -0,0 +1,49 @@
+"""Test cases for the memoized Purchase.flow_stages grouping."""
+
+from sqlalchemy.orm import Session
+
+from app.stages.models import Stage
+
+
+class TestPurchaseFlowStages:
+    """Test that Purchase.flow_stages tracks changes to its stages."""
+
+    def test_flow_stages_is_memoized(self, sample_purchase_with_stages):
+        """Test that repeated reads reuse the same grouping."""
+        purchase = sample_purchase_with_stages
+        assert purchase.flow_stages is purchase.flow_stages
+
+    def test_flow_stages_reflects_priority_change(
+        self, db_session: Session, sample_purchase_with_stages
+    ):
+        """Test that changing a stage priority regroups the stages."""
+        purchase = sample_purchase_with_stages
+        original_levels = len(purchase.flow_stages)
+        assert original_levels > 1
+
+        # Move every stage onto the first priority
+        for stage in purchase.stages:
+            stage.priority = 1
+
+        assert len(purchase.flow_stages) == 1
+        assert len(purchase.flow_stages[0]) == len(purchase.stages)
+
+        db_session.rollback()
+        assert len(purchase.flow_stages) == original_levels
+
+    def test_flow_stages_reflects_added_stage(
+        self, db_session: Session, sample_purchase_with_stages
+    ):
+        """Test that appending a stage regroups the stages."""
+        purchase = sample_purchase_with_stages
+        original_levels = len(purchase.flow_stages)
+        last_stage = purchase.stages[-1]
+
+        purchase.stages.append(
+            Stage(
+                stage_type_id=last_stage.stage_type_id,
+                priority=last_stage.priority + 1,
+            )
+        )
+
+        assert len(purchase.flow_stages) == original_levels + 1
@@ -0,0 +1,50 @@
+"""Test cases for relationship lazy-load detection."""
+
+import logging
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.common.lazy_loads import (
+    LazyLoadDetected,
+    disable_lazy_load_detection,
+    enable_lazy_load_detection,
+)
+from app.purchases.models import Purchase
+
+
+class TestLazyLoadDetection:
+    """Test class for the lazy-load detector."""
+
+    def test_lazy_load_raises_when_forbidden(
+        self, db_session: Session, sample_purchase, forbid_lazy_loads
+    ):
+        """Test that touching an unloaded relationship raises in raise mode."""
+        db_session.expunge_all()
+        purchase = db_session.scalars(
+            select(Purchase).where(Purchase.id == sample_purchase.id)
+        ).one()
+
+        with pytest.raises(LazyLoadDetected) as exc_info:
+            purchase.stages
+
+        assert exc_info.value.path == "Purchase.stages"
+
+    def test_lazy_load_logged_by_default(
+        self, db_session: Session, sample_purchase, caplog
+    ):
+        """Test that lazy loads are only logged when not raising."""
+        db_session.expunge_all()
+        purchase = db_session.scalars(
+            select(Purchase).where(Purchase.id == sample_purchase.id)
+        ).one()
+
+        enable_lazy_load_detection()
+        try:
+            with caplog.at_level(logging.WARNING, logger="app.common.lazy_loads"):
+                assert purchase.stages == []
+        finally:
+            disable_lazy_load_detection()
+
+        assert "Lazy load of Purchase.stages" in caplog.text
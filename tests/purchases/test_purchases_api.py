@@ -1,9 +1,15 @@
 """Test cases for Purchase API endpoints."""
 
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.costs.models import CurrencyEnum
+from app.predefined_flows import service as predefined_flow_service
+from app.predefined_flows.exceptions import PredefinedFlowNotFound
+from app.purchases import service as purchase_service
+from app.purchases.schemas import PurchaseCreate
 
 
 class TestPurchaseAPI:
@@ -113,6 +119,61 @@ class TestPurchaseAPI:
         assert "flow_stages" in data
         assert isinstance(data["flow_stages"], list)
 
+    def test_create_purchase_uses_current_flow_stages(
+        self,
+        test_client: TestClient,
+        sample_purchase_data_ils,
+        predefined_flows_for_purchases,
+    ):
+        """Test that purchase creation picks up flow stage edits immediately."""
+        ils_flow = predefined_flows_for_purchases[0]
+        review_stage_type_id = (
+            predefined_flows_for_purchases[1].predefined_flow_stages[1].stage_type_id
+        )
+
+        response = test_client.post(
+            f"{settings.api_v1_prefix}/purchases/", json=sample_purchase_data_ils
+        )
+        assert response.status_code == 201
+        assert len(response.json()["flow_stages"]) == 2
+
+        response = test_client.patch(
+            f"{settings.api_v1_prefix}/predefined-flows/{ils_flow.id}",
+            json={"stages": [review_stage_type_id]},
+        )
+        assert response.status_code == 200
+
+        response = test_client.post(
+            f"{settings.api_v1_prefix}/purchases/", json=sample_purchase_data_ils
+        )
+        assert response.status_code == 201
+        flow_stages = response.json()["flow_stages"]
+        assert [stage["stage_type"]["id"] for stage in flow_stages] == [
+            review_stage_type_id
+        ]
+
+    def test_create_purchase_after_flow_deleted(
+        self,
+        db_session: Session,
+        sample_purchase_data_ils,
+        predefined_flows_for_purchases,
+    ):
+        """Test that a deleted flow is reported as missing, not reused."""
+        ils_flow = predefined_flows_for_purchases[0]
+        flow_id, _ = predefined_flow_service.get_flow_stage_pairs_by_name(
+            db_session, ils_flow.flow_name
+        )
+        assert flow_id == ils_flow.id
+
+        # Deleted outside the API, as a seeder script or another worker would
+        db_session.delete(ils_flow)
+        db_session.commit()
+
+        with pytest.raises(PredefinedFlowNotFound):
+            purchase_service.create_purchase(
+                db_session, PurchaseCreate(**sample_purchase_data_ils)
+            )
+
     def test_delete_purchase(self, test_client: TestClient, sample_purchase):
         """Test deleting a purchase."""
         response = test_client.delete(
@@ -142,6 +203,33 @@ class TestPurchaseAPI:
         assert "current_pending_stages" in data
         assert "days_since_last_completion" in data
 
+    def test_get_purchase_without_lazy_loads(
+        self, test_client: TestClient, sample_purchase_with_stages, forbid_lazy_loads
+    ):
+        """Test that serializing a purchase needs no relationship lazy loads."""
+        response = test_client.get(
+            f"{settings.api_v1_prefix}/purchases/{sample_purchase_with_stages.id}"
+        )
+
+        assert response.status_code == 200
+        assert response.json()["flow_stages"]
+
+    def test_get_purchase_without_pending_fields(
+        self, test_client: TestClient, sample_purchase
+    ):
+        """Test that include_pending=false omits the pending computed fields."""
+        response = test_client.get(
+            f"{settings.api_v1_prefix}/purchases/{sample_purchase.id}",
+            params={"include_pending": False},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == sample_purchase.id
+        assert "flow_stages" in data
+        assert "current_pending_stages" not in data
+        assert "days_since_last_completion" not in data
+
     def test_get_nonexistent_purchase(self, test_client: TestClient):
         """Test getting a non-existent purchase."""
         response = test_client.get(f"{settings.api_v1_prefix}/purchases/999")
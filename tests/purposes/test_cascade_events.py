@@ -3,6 +3,7 @@
 from sqlalchemy.orm import Session
 
 from app.costs.models import Cost, CurrencyEnum
+from app.purchases import service as purchase_service
 from app.purchases.models import Purchase
 from app.purposes.models import Purpose, PurposeContent
 from app.stage_types.models import StageType
@@ -116,3 +117,21 @@ class TestCascadeEvents:
         # Check purpose last_modified was updated
         db_session.refresh(sample_purpose)
         assert sample_purpose.last_modified > initial_last_modified
+
+    def test_purchase_delete_updates_purpose_last_modified(
+        self, db_session: Session, sample_purpose: Purpose
+    ):
+        """Test that deleting a Purchase with children updates Purpose.last_modified."""
+        purchase = Purchase(purpose_id=sample_purpose.id)
+        purchase.costs.append(Cost(currency=CurrencyEnum.ILS, amount=100.0))
+        db_session.add(purchase)
+        db_session.commit()
+
+        db_session.refresh(sample_purpose)
+        initial_last_modified = sample_purpose.last_modified
+
+        purchase_service.delete_purchase(db_session, purchase.id)
+
+        db_session.refresh(sample_purpose)
+        assert sample_purpose.last_modified > initial_last_modified
+        assert db_session.get(Purchase, purchase.id) is None
@@ -4,10 +4,17 @@ from datetime import date
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app import ResponsibleAuthority, Stage, StageType
 from app.config import settings
+from app.purposes.pending_authority_utils import (
+    get_pending_authority_object,
+    get_pending_authority_purpose_ids_query,
+    get_purchase_pending_authorities,
+    prime_purchase_pending_authorities,
+)
 
 
 class TestPendingAuthority:
@@ -480,3 +487,91 @@ class TestPendingAuthority:
 
         purpose_data = response.json()
         assert purpose_data["pending_authority"]["name"] == "Low Priority Dept"
+
+    def test_purchase_pending_authorities_bulk_matches_single_lookup(
+        self, db_session: Session, setup_pending_authority_data
+    ):
+        """Test that the bulk purchase lookup agrees with the per-purchase query."""
+        purchase = setup_pending_authority_data["purchase"]
+        stage_finance = setup_pending_authority_data["stages"]["finance"]
+
+        authorities = get_purchase_pending_authorities(db_session, [purchase.id])
+        assert authorities[purchase.id].name == "Finance Department"
+
+        # Completing the first stage moves the pending authority to the next one
+        stage_finance.completion_date = date.today()
+        db_session.commit()
+
+        authorities = get_purchase_pending_authorities(db_session, [purchase.id])
+        single = get_pending_authority_object(
+            db_session, purpose_id=purchase.purpose_id, purchase_id=purchase.id
+        )
+        assert authorities[purchase.id].id == single.id
+        assert authorities[purchase.id].name == "Legal Department"
+
+    def test_primed_pending_authority_reset_on_refresh(
+        self, db_session: Session, setup_pending_authority_data
+    ):
+        """Test that a primed pending authority does not outlive a stage change."""
+        purchase = setup_pending_authority_data["purchase"]
+        stage_finance = setup_pending_authority_data["stages"]["finance"]
+
+        prime_purchase_pending_authorities(db_session, [purchase])
+        assert purchase.pending_authority.name == "Finance Department"
+
+        stage_finance.completion_date = date.today()
+        db_session.commit()
+        db_session.refresh(purchase)
+
+        assert purchase.pending_authority.name == "Legal Department"
+
+    def test_pending_authority_purpose_ids_match_single_lookup(
+        self, db_session: Session, setup_pending_authority_data
+    ):
+        """Test that the set-based purpose filter agrees with the per-purpose query."""
+        purpose_id = setup_pending_authority_data["purchase"].purpose_id
+        stage_finance = setup_pending_authority_data["stages"]["finance"]
+
+        for completion_date in (None, date.today()):
+            stage_finance.completion_date = completion_date
+            db_session.commit()
+
+            single = get_pending_authority_object(db_session, purpose_id=purpose_id)
+            matched = db_session.scalars(
+                get_pending_authority_purpose_ids_query([single.id])
+            ).all()
+            assert matched == [purpose_id]
+
+            other_ids = [
+                authority.id
+                for authority in db_session.scalars(select(ResponsibleAuthority))
+                if authority.id != single.id
+            ]
+            assert not db_session.scalars(
+                get_pending_authority_purpose_ids_query(other_ids)
+            ).all()
+
+    def test_purposes_list_includes_purchase_pending_authority(
+        self, test_client: TestClient, setup_pending_authority_data
+    ):
+        """Test that purchases in the purposes list carry their pending authority."""
+        purchase_id = setup_pending_authority_data["purchase"].id
+        response = test_client.get(f"{settings.api_v1_prefix}/purposes")
+        assert response.status_code == 200
+
+        purchases = [
+            purchase
+            for purpose in response.json()["items"]
+            for purchase in purpose["purchases"]
+            if purchase["id"] == purchase_id
+        ]
+        assert purchases[0]["pending_authority"]["name"] == "Finance Department"
+
+    def test_get_purchase_includes_pending_authority(
+        self, test_client: TestClient, setup_pending_authority_data
+    ):
+        """Test that a single purchase carries its pending authority."""
+        purchase_id = setup_pending_authority_data["purchase"].id
+        response = test_client.get(f"{settings.api_v1_prefix}/purchases/{purchase_id}")
+        assert response.status_code == 200
+        assert response.json()["pending_authority"]["name"] == "Finance Department"
@@ -1,10 +1,19 @@
 """Test Purpose CRUD operations using base test mixins."""
 
+import csv
+import io
+from datetime import date, timedelta
+
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from app import Purchase, Stage
 from app.config import settings
-from app.purposes.models import StatusEnum
+from app.files.models import FileAttachment
+from app.purposes import csv_export
+from app.purposes.models import PurposeContent, StatusEnum
+from app.services.models import Service
+from app.stage_types.models import StageType
 from tests.base import BaseAPITestClass
 from tests.utils import APITestHelper, assert_paginated_response
 
@@ -431,3 +440,206 @@ class TestPurposesApi(BaseAPITestClass):
         # Test filtering by non-existent budget source ID
         response_data = helper.list_resources(budget_source_id=999999)
         assert len(response_data["items"]) == 0
+
+    def test_export_csv_streams_rows(self, test_client: TestClient, multiple_purposes):
+        """Test that the CSV export contains a header and one row per purpose."""
+        response = test_client.get(f"{self.resource_endpoint}/export_csv")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert rows[0][:3] == ["ID", "Description", "Status"]
+        assert {row[0] for row in rows[1:]} == {
+            str(purpose["id"]) for purpose in multiple_purposes
+        }
+
+    def test_export_csv_purpose_columns(
+        self,
+        test_client: TestClient,
+        sample_purpose_data_with_contents,
+        sample_supplier,
+        sample_service,
+        sample_hierarchy,
+    ):
+        """Test that joined purpose columns are exported and filters still apply."""
+        response = test_client.post(
+            self.resource_endpoint,
+            json={
+                **sample_purpose_data_with_contents,
+                "supplier_id": sample_supplier.id,
+                "service_type_id": sample_service.service_type_id,
+            },
+        )
+        assert response.status_code == 201
+        purpose_id = str(response.json()["id"])
+
+        response = test_client.get(
+            f"{self.resource_endpoint}/export_csv",
+            params={
+                "hierarchy_id": [sample_hierarchy.id],
+                "service_id": [sample_service.id],
+                "search": "Test",
+            },
+        )
+
+        assert response.status_code == 200
+        header, row = list(csv.reader(io.StringIO(response.text)))
+        values = dict(zip(header, row))
+        assert values["ID"] == purpose_id
+        assert values["Hierarchy"] == sample_hierarchy.path
+        assert values["Supplier"] == sample_supplier.name
+        assert values["Service Type"] == sample_service.service_type.name
+        assert values["Services"] == f"2 {sample_service.name}"
+
+    def test_export_csv_sorting(self, test_client: TestClient, sample_hierarchy):
+        """Test that the export applies the requested sort order."""
+        purpose_ids = {}
+        for expected_delivery in ("2025-03-01", "2025-01-01", "2025-02-01"):
+            response = test_client.post(
+                self.resource_endpoint,
+                json={
+                    "hierarchy_id": sample_hierarchy.id,
+                    "expected_delivery": expected_delivery,
+                    "status": StatusEnum.IN_PROGRESS.value,
+                    "contents": [],
+                },
+            )
+            assert response.status_code == 201
+            purpose_ids[expected_delivery] = str(response.json()["id"])
+
+        response = test_client.get(
+            f"{self.resource_endpoint}/export_csv",
+            params={"sort_by": "expected_delivery", "sort_order": "asc"},
+        )
+
+        assert response.status_code == 200
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert [row[0] for row in rows[1:]] == [
+            purpose_ids[expected_delivery] for expected_delivery in sorted(purpose_ids)
+        ]
+
+    def test_export_csv_across_batches(
+        self, test_client: TestClient, multiple_purposes, monkeypatch
+    ):
+        """Test that exports spanning several fetch batches include every purpose."""
+        monkeypatch.setattr(csv_export, "EXPORT_BATCH_SIZE", 3)
+        monkeypatch.setattr(csv_export, "CSV_ROWS_PER_CHUNK", 2)
+
+        response = test_client.get(f"{self.resource_endpoint}/export_csv")
+
+        assert response.status_code == 200
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert len(rows) == len(multiple_purposes) + 1
+
+    def test_export_csv_stage_columns(
+        self,
+        test_client: TestClient,
+        db_session: Session,
+        sample_purpose,
+        forbid_lazy_loads,
+    ):
+        """Test that stage IDs, completion dates and pending stages are exported."""
+        emf_type = StageType(name="emf_id", display_name="EMF ID")
+        order_type = StageType(name="order_id", display_name="Order ID")
+        db_session.add_all([emf_type, order_type])
+        db_session.flush()
+
+        completed_purchase = Purchase(purpose_id=sample_purpose.id)
+        pending_purchase = Purchase(purpose_id=sample_purpose.id)
+        db_session.add_all([completed_purchase, pending_purchase])
+        db_session.flush()
+
+        completion_date = date.today() - timedelta(days=3)
+        db_session.add_all(
+            [
+                Stage(
+                    purchase_id=completed_purchase.id,
+                    stage_type_id=emf_type.id,
+                    priority=1,
+                    value="EMF001",
+                    completion_date=completion_date,
+                ),
+                Stage(
+                    purchase_id=completed_purchase.id,
+                    stage_type_id=order_type.id,
+                    priority=2,
+                ),
+                Stage(
+                    purchase_id=pending_purchase.id,
+                    stage_type_id=emf_type.id,
+                    priority=1,
+                ),
+            ]
+        )
+        db_session.commit()
+
+        response = test_client.get(f"{self.resource_endpoint}/export_csv")
+
+        assert response.status_code == 200
+        header, row = list(csv.reader(io.StringIO(response.text)))
+        values = dict(zip(header, row))
+        assert values["Purchases"] == (
+            f"{completed_purchase.id}\n{pending_purchase.id}"
+        )
+        assert values["EMF IDs"] == "EMF001"
+        assert values["EMF IDs Completion Date"] == completion_date.isoformat()
+        assert values["Order IDs"] == ""
+        assert values["Pending Stages"] == "3 days in order_id\n"
+
+    def test_export_csv_file_attachments(
+        self, test_client: TestClient, db_session: Session, sample_purpose
+    ):
+        """Test that file attachment names are exported one per line."""
+        sample_purpose.file_attachments = [
+            FileAttachment(
+                original_filename=filename,
+                s3_key=f"files/{filename}",
+                mime_type="application/pdf",
+                file_size=1024,
+            )
+            for filename in ("quote.pdf", "invoice.pdf")
+        ]
+        db_session.commit()
+
+        response = test_client.get(f"{self.resource_endpoint}/export_csv")
+
+        assert response.status_code == 200
+        header, row = list(csv.reader(io.StringIO(response.text)))
+        file_attachments = dict(zip(header, row))["File Attachments"]
+        assert sorted(file_attachments.split("\n")) == ["invoice.pdf", "quote.pdf"]
+
+    def test_export_csv_filters_do_not_repeat_purposes(
+        self,
+        test_client: TestClient,
+        db_session: Session,
+        sample_purpose,
+        sample_service,
+        sample_budget_source,
+    ):
+        """Test that purposes with several matching children are exported once."""
+        second_service = Service(
+            name="Second Service", service_type_id=sample_service.service_type_id
+        )
+        db_session.add(second_service)
+        db_session.flush()
+        sample_purpose.contents = [
+            PurposeContent(service_id=service.id, quantity=1)
+            for service in (sample_service, second_service)
+        ]
+        sample_purpose.purchases = [
+            Purchase(budget_source_id=sample_budget_source.id) for _ in range(2)
+        ]
+        db_session.commit()
+
+        for params in (
+            {"budget_source_id": [sample_budget_source.id]},
+            {"service_id": [sample_service.id, second_service.id]},
+        ):
+            response = test_client.get(
+                f"{self.resource_endpoint}/export_csv", params=params
+            )
+
+            assert response.status_code == 200
+            header, *rows = list(csv.reader(io.StringIO(response.text)))
+            assert [row[0] for row in rows] == [str(sample_purpose.id)]